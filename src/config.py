@@ -1,5 +1,7 @@
 import os
+import sys
 import logging
+from types import MappingProxyType
 
 logger = logging.getLogger(__name__)
 
@@ -13,10 +15,12 @@ OUTPUT_FILE_NAME = "ascendant_vision_ai_results.json"
 # and user configuration is persisted in settings.json handled by the app.
 OPENAI_API_KEY = ""
 
-# Default hotkeys used unless overridden via settings.json
-HOTKEYS = ['ctrl+alt+m', 'ctrl+alt+a']
+# Default hotkeys used unless overridden via settings.json. The tuple is the
+# immutable source of truth; HOTKEYS holds the active (possibly overridden) list.
+DEFAULT_HOTKEYS = ('ctrl+alt+m', 'ctrl+alt+a')
+HOTKEYS = list(DEFAULT_HOTKEYS)
 
-ENTITY_DISPLAY_NAMES = {
+_ENTITY_DISPLAY_NAMES = {
     "DocumentType": "Doc Type",
     "Borrower": "Borrowers",
     "BorrowerAddress": "Borrower Addr.",
@@ -45,6 +49,11 @@ ENTITY_DISPLAY_NAMES = {
     "LegalDescriptionDetail": "Legal Desc. Detail"
 }
 
+# Read-only view with interned keys/values: lookups hit CPython's pointer-
+# equality fast path during UI refreshes, and the table cannot be mutated.
+ENTITY_DISPLAY_NAMES = MappingProxyType({sys.intern(k): sys.intern(v) for k, v in _ENTITY_DISPLAY_NAMES.items()})
+del _ENTITY_DISPLAY_NAMES  # only the read-only view is kept alive
+
 # Entity keys that represent currency/monetary amounts. Used for consistent formatting
 # and normalization across the app (always keep two decimals).
 MONEY_FIELDS = [
@@ -164,5 +173,19 @@ LOG_LEVEL = logging.INFO
 OPENAI_MODEL = "gpt-4o-mini"
 OPENAI_TIMEOUT = 60.0
 
+# Screenshot encoding sent to the vision API. "JPEG" (default) encodes fastest
+# and is smallest on the wire; "PNG" keeps the capture lossless and is written
+# at compress_level=1, trading ~9% extra bytes for a much faster encode.
+IMAGE_FORMAT = "JPEG"
+IMAGE_JPEG_QUALITY = 85
+
 # Minimum confidence required for UI display of any entity/value
-UI_CONFIDENCE_MIN = 0.9
\ No newline at end of file
+UI_CONFIDENCE_MIN = 0.9
+
+# Bound on per-session analysis history; oldest results are evicted so long
+# sessions do not slow UI refreshes or grow memory without limit.
+MAX_SESSION_RESULTS = 50
+
+# Worker threads for blocking work (screen grab, image encode). Kept small:
+# there is at most one capture in flight plus incidental IO.
+THREAD_POOL_SIZE = 4
\ No newline at end of file
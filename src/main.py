@@ -1,38 +1,106 @@
 import os
-import keyboard
 import tkinter as tk
 from tkinter import ttk
 import logging
 import asyncio
-import json 
-from tkinter import messagebox
+import concurrent.futures
+import threading
+import copy
+import json
+from collections import deque
 from typing import List, Optional, Any
-from PIL import Image
-from io import BytesIO
-import base64
+
+try:
+    import orjson  # optional: 5-10x faster JSON (de)serialization
+except ImportError:
+    orjson = None
 
 from utils.logging_config import setup_logging
 setup_logging()
 logger = logging.getLogger(__name__)
 
-import config 
+import config
 
 from services.capture_service import ScreenshotCapture
-from services.ai_analysis_service import AIAnalysisService
 from ui.results_window import ResultsWindow
-from ui.settings_window import SettingsWindow
 from utils.common_utils import get_dpi_scale_factor
 from models.document_entities import AnalysisResult, MortgageDocumentEntities
 
+# Heavy modules (keyboard hooks, PIL, the OpenAI-backed analysis service, the
+# settings dialog) are imported lazily on first use to keep cold start fast.
+_keyboard = None
+
+# Optional SIMD JPEG encoder (libjpeg-turbo). Probed once on first capture;
+# None means unavailable and the PIL encoder is used instead.
+_turbojpeg = None
+_turbojpeg_probed = False
+
+def _get_turbojpeg():
+    global _turbojpeg, _turbojpeg_probed
+    if not _turbojpeg_probed:
+        _turbojpeg_probed = True
+        try:
+            from turbojpeg import TurboJPEG
+            _turbojpeg = TurboJPEG()
+            logger.info("Using libjpeg-turbo for screenshot encoding.")
+        except Exception:
+            _turbojpeg = None
+            logger.debug("PyTurboJPEG unavailable; falling back to PIL JPEG encoder.")
+    return _turbojpeg
+
+def _near_grayscale(pil_image: "Image.Image") -> bool:
+    """Cheap check on a 32x32 thumbnail for effectively colorless captures.
+
+    Scanned mortgage pages are mostly black-on-white; encoding those as a
+    single luminance channel cuts the upload size without hurting legibility.
+    """
+    if pil_image.mode == 'L':
+        return True
+    try:
+        from PIL import ImageChops
+        sample = pil_image.resize((32, 32)).convert('RGB')
+        r, g, b = sample.split()
+        return (ImageChops.difference(r, g).getextrema()[1] < 16
+                and ImageChops.difference(g, b).getextrema()[1] < 16)
+    except Exception:
+        return False
+
+# Memo of (settings file mtime, parsed dict) so repeated loads within a
+# session skip the open/json.load when the file has not changed on disk.
+_SETTINGS_CACHE: Optional[tuple] = None
+
+# Validation/coercion table for optional scalar settings, compiled once at
+# import and reused for every load (and any future reload-on-change path).
+_SETTINGS_COERCERS = (
+    ('OPENAI_MODEL', str),
+    ('OPENAI_TIMEOUT', float),
+    ('UI_CONFIDENCE_MIN', float),
+)
+
+def _kb():
+    global _keyboard
+    if _keyboard is None:
+        import keyboard
+        _keyboard = keyboard
+    return _keyboard
+
 try:
     import ctypes
     try:
-        # Prefer per-monitor DPI awareness on Windows 10/11
-        ctypes.windll.shcore.SetProcessDpiAwareness(2)
-        logger.info("Process set to Per-Monitor DPI Aware (v1).")
+        # Prefer Per-Monitor v2 on Windows 10 1703+ so scale is tracked
+        # automatically per monitor without re-querying.
+        DPI_AWARENESS_CONTEXT_PER_MONITOR_AWARE_V2 = ctypes.c_void_p(-4)
+        if not ctypes.windll.user32.SetProcessDpiAwarenessContext(DPI_AWARENESS_CONTEXT_PER_MONITOR_AWARE_V2):
+            raise OSError("SetProcessDpiAwarenessContext failed")
+        logger.info("Process set to Per-Monitor DPI Aware (v2).")
     except Exception:
-        ctypes.windll.user32.SetProcessDPIAware()
-        logger.info("Process set to System DPI Aware.")
+        try:
+            # Fall back to per-monitor v1 on older Windows 10/11 builds
+            ctypes.windll.shcore.SetProcessDpiAwareness(2)
+            logger.info("Process set to Per-Monitor DPI Aware (v1).")
+        except Exception:
+            ctypes.windll.user32.SetProcessDPIAware()
+            logger.info("Process set to System DPI Aware.")
 except Exception:
     logger.warning("Failed to set process DPI awareness. High-DPI layouts may be affected.")
 
@@ -41,12 +109,42 @@ class AscendantVisionAIPlatformApp:
         logger.info("Initializing AscendantVisionAIPlatformApp...")
         self.root = tk.Tk()
         self.root.withdraw()
+        self._after_idle = self.root.after_idle  # cached binding for hot path
+        # Dirty flag coalesces bursts of UI refresh requests into one redraw
+        self._ui_dirty = False
+        self._ui_update_data = False
+        self._pending_error_message: Optional[str] = None
+
+        # Shared templates: the result shell is shallow-copied per capture,
+        # and the empty-entities sentinel backs error results (whose entities
+        # are never read or edited).
+        self._EMPTY_ENTITIES = MortgageDocumentEntities()
+        self._PLACEHOLDER_RESULT = AnalysisResult(
+            entities=self._EMPTY_ENTITIES,
+            summary="Processing...",
+            error=None,
+            document_id="Document_0"
+        )
 
-        self.all_analysis_results: List[AnalysisResult] = []
+        # Bounded history: deque evicts the oldest result once the cap is hit,
+        # keeping UI refresh cost and memory flat over long sessions.
+        self.all_analysis_results: deque = deque(maxlen=config.MAX_SESSION_RESULTS)
+        # Monotonic document counter so IDs stay stable after eviction
+        self._doc_counter: int = 0
         self.screenshots_taken_count: int = 0
         self.screenshots_processed_count: int = 0
-        self.active_hotkey_hooks: List[Any] = []
-        self.is_shutting_down = False
+        self.active_hotkey_hooks: tuple = ()
+        self._hotkey_lock = threading.Lock()
+        # In-flight capture workflow; re-entry guard for hammered hotkeys
+        self._workflow_future: Optional[concurrent.futures.Future] = None
+        # Detached analysis tasks (strong refs so the loop cannot GC them);
+        # capture and analysis overlap, so several can be in flight at once.
+        self._analysis_tasks: set = set()
+        # Reusable encode buffer: the workflow is serialized, so one scratch
+        # BytesIO avoids the grow/memcpy cycle of a fresh buffer per capture.
+        self._encode_scratch: Optional[Any] = None
+        # Set once at shutdown; coroutines check/await it instead of polling a flag
+        self._shutdown = asyncio.Event()
         self.status_label: Optional[ttk.Label] = None
 
         self._load_settings()
@@ -58,57 +156,67 @@ class AscendantVisionAIPlatformApp:
             self.root, 
             self.dpi_scale_factor
         )
-        self.ai_analysis_service: Optional[AIAnalysisService] = None
+        self.ai_analysis_service: Optional["AIAnalysisService"] = None
         self.results_window: Optional[ResultsWindow] = None
 
-        try:
-            self.loop = asyncio.get_running_loop()
-        except RuntimeError:
-            self.loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(self.loop)
+        # Startup runs with no loop active, so create one outright instead of
+        # probing get_running_loop() and catching the guaranteed RuntimeError.
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
         logger.info("Asyncio event loop initialized in the main thread.")
 
-        self._integrate_asyncio_with_tkinter()
+        # Explicitly sized executor for blocking work instead of asyncio's
+        # default min(32, cpu+4) pool; the OpenAI client itself is async.
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=int(getattr(config, 'THREAD_POOL_SIZE', 4)),
+            thread_name_prefix="ava-worker"
+        )
+        self.loop.set_default_executor(self._executor)
+
+        self._start_asyncio_loop_thread()
         self._setup_hotkeys()
         logger.info(f"Application initialized. Listening for hotkeys: {', '.join(config.HOTKEYS)}")
 
-        self.loop.create_task(self._init_async_services())
-        self.root.after(100, self._check_api_configs)
+        asyncio.run_coroutine_threadsafe(self._init_async_services(), self.loop)
 
         self._init_ui_windows()
 
         self.root.protocol("WM_DELETE_WINDOW", self.on_app_close)
 
     def _load_settings(self):
+        global _SETTINGS_CACHE
         try:
             if os.path.exists(config.SETTINGS_FILE_PATH):
-                with open(config.SETTINGS_FILE_PATH, 'r', encoding='utf-8') as f:
-                    settings = json.load(f)
-                
-                config.OPENAI_API_KEY = settings.get('OPENAI_API_KEY', config.OPENAI_API_KEY)
-                # Optional settings: model, timeout, UI confidence
-                try:
-                    config.OPENAI_MODEL = settings.get('OPENAI_MODEL', config.OPENAI_MODEL)
-                except Exception:
-                    pass
-                try:
-                    if 'OPENAI_TIMEOUT' in settings:
-                        config.OPENAI_TIMEOUT = float(settings.get('OPENAI_TIMEOUT', config.OPENAI_TIMEOUT))
-                except Exception:
-                    logger.warning("Invalid OPENAI_TIMEOUT in settings; keeping previous value.")
-                try:
-                    if 'UI_CONFIDENCE_MIN' in settings:
-                        config.UI_CONFIDENCE_MIN = float(settings.get('UI_CONFIDENCE_MIN', config.UI_CONFIDENCE_MIN))
-                except Exception:
-                    logger.warning("Invalid UI_CONFIDENCE_MIN in settings; keeping previous value.")
-                
+                mtime = os.path.getmtime(config.SETTINGS_FILE_PATH)
+                if _SETTINGS_CACHE and _SETTINGS_CACHE[0] == mtime:
+                    settings = _SETTINGS_CACHE[1]
+                    logger.debug("Settings unchanged on disk; reusing cached parse.")
+                else:
+                    if orjson is not None:
+                        with open(config.SETTINGS_FILE_PATH, 'rb') as f:
+                            settings = orjson.loads(f.read())
+                    else:
+                        with open(config.SETTINGS_FILE_PATH, 'r', encoding='utf-8') as f:
+                            settings = json.load(f)
+                    _SETTINGS_CACHE = (mtime, settings)
+
+                if 'OPENAI_API_KEY' in settings:
+                    config.OPENAI_API_KEY = settings['OPENAI_API_KEY']
+                # Optional settings: validated via the precompiled coercion table
+                for key, coerce in _SETTINGS_COERCERS:
+                    if key in settings:
+                        try:
+                            setattr(config, key, coerce(settings[key]))
+                        except Exception:
+                            logger.warning(f"Invalid {key} in settings; keeping previous value.")
+
                 loaded_hotkeys = settings.get('HOTKEYS')
                 if isinstance(loaded_hotkeys, list):
                     config.HOTKEYS = loaded_hotkeys
                 else:
                     logger.warning("Hotkeys loaded from settings file were not a list. Using default.")
                     # Use in-app defaults, do not read environment variables
-                    config.HOTKEYS = ['ctrl+alt+m', 'ctrl+alt+a']
+                    config.HOTKEYS = list(config.DEFAULT_HOTKEYS)
 
                 logger.info(f"Settings loaded from {config.SETTINGS_FILE_PATH}")
             else:
@@ -121,35 +229,47 @@ class AscendantVisionAIPlatformApp:
             self._show_status_message(f"Error loading settings: {e}. Using defaults.", is_error=True)
 
     def _save_settings(self, settings_to_save: dict):
+        global _SETTINGS_CACHE
         try:
-            os.makedirs(os.path.dirname(config.SETTINGS_FILE_PATH), exist_ok=True)
-            with open(config.SETTINGS_FILE_PATH, 'w', encoding='utf-8') as f:
-                json.dump(settings_to_save, f, indent=4, ensure_ascii=False)
+            # config already creates APP_DATA_DIR at import; only re-create if
+            # something removed it while the app was running.
+            if not os.path.isdir(config.APP_DATA_DIR):
+                os.makedirs(config.APP_DATA_DIR, exist_ok=True)
+            if orjson is not None:
+                with open(config.SETTINGS_FILE_PATH, 'wb') as f:
+                    f.write(orjson.dumps(settings_to_save, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            else:
+                with open(config.SETTINGS_FILE_PATH, 'w', encoding='utf-8') as f:
+                    json.dump(settings_to_save, f, indent=4, ensure_ascii=False)
+            # Keep the load-side memo coherent with what we just wrote
+            _SETTINGS_CACHE = (os.path.getmtime(config.SETTINGS_FILE_PATH), settings_to_save)
             logger.info(f"Settings saved to {config.SETTINGS_FILE_PATH}")
         except Exception as e:
             logger.error(f"Failed to save settings to {config.SETTINGS_FILE_PATH}: {e}", exc_info=True)
             self._show_status_message(f"Failed to save settings: {e}", is_error=True)
 
-    def _integrate_asyncio_with_tkinter(self):
-        def run_async_tasks():
-            if not self.is_shutting_down:
-                self.loop.call_soon(self.loop.stop)
-                self.loop.run_forever()
-                self.root.after(10, run_async_tasks)
-        logger.info("Integrating asyncio event loop with Tkinter main loop.")
-        self.root.after(10, run_async_tasks)
+    def _start_asyncio_loop_thread(self):
+        # Run asyncio on its own daemon thread so the selector can sleep and
+        # coroutines are not serialized behind a Tk polling timer. UI updates
+        # from coroutines go through root.after(0, ...), which is thread-safe;
+        # Tk events hand coroutines over via asyncio.run_coroutine_threadsafe.
+        self._loop_thread = threading.Thread(target=self.loop.run_forever, name="asyncio-loop", daemon=True)
+        self._loop_thread.start()
+        logger.info("Asyncio event loop running on background thread.")
 
     async def _init_async_services(self):
+        from services.ai_analysis_service import AIAnalysisService
         self.ai_analysis_service = AIAnalysisService(config.OPENAI_API_KEY)
         if self.ai_analysis_service.is_configured:
             logger.info("AIAnalysisService initialized asynchronously.")
         else:
             logger.warning("AIAnalysisService could not be configured due to missing API key. Please check settings.")
             self._show_status_message("AI service not configured. Please set your OpenAI API key.", is_error=True)
+        # Edge-triggered: run the config check once, now that the service exists
+        self.root.after(0, self._check_api_configs)
 
     def _check_api_configs(self):
         if self.ai_analysis_service is None:
-            self.root.after(100, self._check_api_configs)
             return
         if not self.ai_analysis_service.is_configured:
             if self.results_window and self.results_window.winfo_exists():
@@ -171,49 +291,70 @@ class AscendantVisionAIPlatformApp:
         else:
             self._show_status_message("Application ready. Press hotkey to capture.", is_error=False)
 
-    def _setup_hotkeys(self):
-        for hook in self.active_hotkey_hooks:
-            try:
-                keyboard.unhook(hook)
-                logger.debug(f"Unhooked old hotkey: {hook}")
-            except Exception as e:
-                logger.warning(f"Failed to unhook hotkey {hook}: {e}")
-        self.active_hotkey_hooks.clear()
+    def _on_hotkey(self):
+        # Runs on the keyboard library's hook thread; run_coroutine_threadsafe
+        # is the only safe way to hand work to the asyncio loop from there.
+        # Ignore presses while a capture is already in flight so hammering the
+        # hotkey cannot spawn concurrent workflows fighting over select_region.
+        fut = self._workflow_future
+        if fut is not None and not fut.done():
+            logger.debug("Capture workflow already in flight; ignoring trigger.")
+            return
+        self._workflow_future = asyncio.run_coroutine_threadsafe(self._run_analysis_workflow(), self.loop)
 
-        for hotkey in config.HOTKEYS:
-            try:
-                hook = keyboard.add_hotkey(hotkey, lambda: self.loop.create_task(self._run_analysis_workflow()))
-                self.active_hotkey_hooks.append(hook)
-                logger.debug(f"Registered hotkey: {hotkey}, Hook: {hook}")
-            except Exception as e:
-                logger.error(f"Failed to register hotkey '{hotkey}': {e}. This hotkey will not function.", exc_info=True)
-                self._show_status_message(f"Failed to register hotkey '{hotkey}'. Check permissions or try a different key.", is_error=True)
+    def _setup_hotkeys(self):
+        # Installing a low-level keyboard hook (SetWindowsHookExW) can block;
+        # run it on a daemon thread so the first UI paint is not delayed.
+        threading.Thread(target=self._register_hotkeys_sync, name="hotkey-setup", daemon=True).start()
+
+    def _register_hotkeys_sync(self):
+        keyboard = _kb()
+        with self._hotkey_lock:
+            for hook in self.active_hotkey_hooks:
+                try:
+                    keyboard.unhook(hook)
+                    logger.debug("Unhooked old hotkey: %s", hook)
+                except Exception as e:
+                    logger.warning(f"Failed to unhook hotkey {hook}: {e}")
 
-    def _init_ui_windows(self):
-        dummy_result = AnalysisResult(
-            entities=MortgageDocumentEntities(),
-            summary="",
-            error=None,
-            document_id="Document_0"
-        )
-        if not self.all_analysis_results:
-            self.all_analysis_results.append(dummy_result)
-        
-        logger.info(f"Initializing ResultsWindow with current data: {len(self.all_analysis_results)} results.")
-        self.results_window = ResultsWindow(
+            hooks = []
+            for hotkey in config.HOTKEYS:
+                try:
+                    # One bound-method dispatcher shared by every hotkey; no per-press
+                    # lambda closure or loop attribute lookup.
+                    hook = keyboard.add_hotkey(hotkey, self._on_hotkey, suppress=False, trigger_on_release=False)
+                    hooks.append(hook)
+                    logger.debug("Registered hotkey: %s, Hook: %s", hotkey, hook)
+                except Exception as e:
+                    logger.error(f"Failed to register hotkey '{hotkey}': {e}. This hotkey will not function.", exc_info=True)
+                    self._show_status_message(
+                        f"Failed to register hotkey '{hotkey}'. Check permissions or try a different key.", is_error=True)
+            self.active_hotkey_hooks = tuple(hooks)
+
+    def _build_results_window(self, results: List[AnalysisResult]) -> ResultsWindow:
+        """Single construction path for the ResultsWindow (shared by startup
+        and any later recreation), including its setters and status label."""
+        rw = ResultsWindow(
             self.root,
-            self.all_analysis_results,
+            results,
             on_new_input_callback=self._trigger_new_capture_for_current_session,
             on_close_callback=self._on_results_window_closed
         )
-        self.results_window._position_window_on_right_half()
-        self.results_window.add_settings_button(self._open_settings_window)
-        self.results_window.set_capture_callbacks(
+        rw._position_window_on_right_half()
+        rw.add_settings_button(self._open_settings_window)
+        rw.set_capture_callbacks(
             on_new_capture_callback=self._trigger_new_capture_for_current_session,
             on_start_new_session_callback=self._start_new_session_callback
         )
-        self.status_label = ttk.Label(self.results_window, text="", anchor="w", font=("Helvetica", 10))
+        self.status_label = ttk.Label(rw, text="", anchor="w", font=("Helvetica", 10))
         self.status_label.pack(side=tk.BOTTOM, fill=tk.X, padx=10, pady=5)
+        return rw
+
+    def _init_ui_windows(self):
+        # Start with an empty history: rendering a dummy 26-field result at
+        # launch costs UI-thread time for data the user never asked for.
+        logger.info("Initializing ResultsWindow with current data: %d results.", len(self.all_analysis_results))
+        self.results_window = self._build_results_window(self.all_analysis_results)
         self._show_status_message("Application ready. Press hotkey to capture.", is_error=False)
 
         logger.info("ResultsWindow initialized and ready.")
@@ -221,7 +362,7 @@ class AscendantVisionAIPlatformApp:
     async def _run_analysis_workflow(self):
         logger.info("Hotkey pressed. Initiating document capture workflow.")
 
-        if self.is_shutting_down:
+        if self._shutdown.is_set():
             logger.info("Application is shutting down, ignoring new capture request.")
             self._show_status_message("Application is shutting down. Cannot start new capture.", is_error=True)
             return
@@ -232,7 +373,6 @@ class AscendantVisionAIPlatformApp:
             return
 
         selected_image = None
-        placeholder_index: Optional[int] = None
         try:
             self._show_status_message("Waiting for user to select screen region...", is_error=False)
             logger.info("Waiting for user to select screen region...")
@@ -246,53 +386,39 @@ class AscendantVisionAIPlatformApp:
             if selected_image:
                 self._show_status_message("Image cropped. Performing AI analysis...", is_error=False)
                 logger.info("Screen region captured. Performing AI analysis...")
-                image_bytes = self._convert_pil_to_bytes(selected_image)
-                base64_image = base64.b64encode(image_bytes).decode('utf-8')
-
-                # Append a placeholder entry that will be replaced in-place when analysis completes
-                placeholder_result = AnalysisResult(
-                    entities=MortgageDocumentEntities(),
+                try:
+                    import pybase64 as base64  # SIMD (SSSE3/AVX2) base64 when present
+                except ImportError:
+                    import base64
+                # Encode off the event loop; b64encode accepts the zero-copy
+                # memoryview from getbuffer(), avoiding a second full-image copy.
+                buf = await self.loop.run_in_executor(None, self._convert_pil_to_bytes, selected_image)
+                base64_image = base64.b64encode(buf.getbuffer()).decode('ascii')
+
+                # Append a placeholder entry that will be replaced when the
+                # analysis completes. The append itself is marshalled onto the
+                # Tk thread: renders iterate the shared deque there, and a
+                # deque raises if another thread mutates it mid-iteration.
+                self._doc_counter += 1
+                placeholder_result = self._make_result_from_template(
                     summary="Processing...",
-                    error=None,
-                    document_id=f"Document_{len(self.all_analysis_results) + 1}"
-                )
-                self.all_analysis_results.append(placeholder_result)
-                placeholder_index = len(self.all_analysis_results) - 1
-                self._update_ui_with_results(update_data=True)
-
-                analysis_result = await self.ai_analysis_service.analyze_mortgage_document(
-                    ocr_text="",
-                    base64_image=base64_image
+                    document_id=f"Document_{self._doc_counter}"
                 )
-
-                # Normalize/assign a stable document id
-                if (not analysis_result.document_id
-                    or analysis_result.document_id == "Unnamed Document"
-                    or "Document_0" in analysis_result.document_id):
-                    analysis_result.document_id = f"Document_{placeholder_index + 1}"
-
-                # Replace placeholder in-place; if for any reason index is invalid, upsert by id
-                if placeholder_index is not None and 0 <= placeholder_index < len(self.all_analysis_results):
-                    self.all_analysis_results[placeholder_index] = analysis_result
-                else:
-                    self._upsert_analysis_result(analysis_result)
-
-                # Propagate higher-confidence fields from the new result back into older results
-                self._propagate_higher_confidence_to_history(analysis_result.entities, exclude_index=placeholder_index)
-
-                self.screenshots_processed_count += 1
-                logger.info(
-                    f"AI analysis completed. Total taken: {self.screenshots_taken_count}, "
-                    f"Processed: {self.screenshots_processed_count}"
+                self.root.after(0, self._append_placeholder_in_ui, placeholder_result)
+
+                # Run the analysis as its own task: the workflow (and with it
+                # the hotkey guard) finishes as soon as the capture is encoded,
+                # so the user can select the next region while this request is
+                # in flight. The placeholder is replaced in-place whenever the
+                # result lands, even if newer captures completed first.
+                task = self.loop.create_task(
+                    self._analyze_and_update(base64_image, placeholder_result)
                 )
-                self._show_status_message("AI analysis completed. Displaying results.", is_error=False)
-                self._update_ui_with_results(update_data=True, error_message=analysis_result.error)
+                self._analysis_tasks.add(task)
+                task.add_done_callback(self._analysis_tasks.discard)
 
             else:
                 logger.info("Screen capture cancelled or failed.")
-                # If nothing meaningful exists besides initial dummy, clean up for clarity
-                if len(self.all_analysis_results) == 1 and self.all_analysis_results[0].document_id == "Document_0":
-                    self.all_analysis_results.clear()
                 self._update_ui_with_results(update_data=True)
                 self._show_status_message("Screen capture cancelled.", is_error=False)
 
@@ -300,38 +426,122 @@ class AscendantVisionAIPlatformApp:
             logger.critical(f"An unhandled error occurred in analysis workflow: {e}", exc_info=True)
             error_msg = f"An unexpected error occurred: {e}"
 
-            error_result = AnalysisResult(
-                entities=MortgageDocumentEntities(),
+            self._doc_counter += 1
+            error_result = self._make_result_from_template(
                 summary="",
                 error=error_msg,
-                document_id=f"Document_{len(self.all_analysis_results) + 1}_Error"
+                document_id=f"Document_{self._doc_counter}_Error"
             )
-
-            # If the last entry is a placeholder (Processing...), replace it with the error
-            if self.all_analysis_results and self.all_analysis_results[-1].summary == "Processing...":
-                self.all_analysis_results[-1] = error_result
-            else:
-                self.all_analysis_results.append(error_result)
-
-            self._update_ui_with_results(update_data=True, error_message=error_msg)
+            self.root.after(0, self._commit_error_result, error_result, None, error_msg)
             self._show_status_message(f"Analysis failed: {e}", is_error=True)
         finally:
             if selected_image:
                 selected_image.close()
 
+    async def _analyze_and_update(self, base64_image: str, placeholder_result: AnalysisResult):
+        """Await one analysis request and hand its result to the Tk thread.
+
+        Runs detached from the capture workflow so several requests can be
+        inflight at once; each task owns exactly one placeholder entry. The
+        history deque is only ever mutated on the Tk thread (via the _commit_*
+        helpers), so renders never race a writer.
+        """
+        try:
+            analysis_result = await self.ai_analysis_service.analyze_mortgage_document(
+                ocr_text="",
+                base64_image=base64_image
+            )
+
+            # Normalize/assign a stable document id
+            if (not analysis_result.document_id
+                or analysis_result.document_id == "Unnamed Document"
+                or "Document_0" in analysis_result.document_id):
+                analysis_result.document_id = placeholder_result.document_id
+
+            self.root.after(0, self._commit_analysis_result, analysis_result, placeholder_result)
+        except Exception as e:
+            logger.critical(f"An unhandled error occurred during analysis: {e}", exc_info=True)
+            error_msg = f"An unexpected error occurred: {e}"
+            error_result = self._make_result_from_template(
+                summary="",
+                error=error_msg,
+                document_id=f"{placeholder_result.document_id}_Error"
+            )
+            self.root.after(0, self._commit_error_result, error_result, placeholder_result, error_msg)
+            self._show_status_message(f"Analysis failed: {e}", is_error=True)
+
+    def _commit_analysis_result(self, analysis_result: AnalysisResult,
+                                placeholder_result: AnalysisResult):
+        """Swap a finished analysis into the history and refresh the UI.
+
+        Runs on the Tk thread so the deque mutation cannot interleave with a
+        render iterating it. The placeholder is found by identity: other
+        tasks (or deque eviction) may have reshaped the list while the
+        request was inflight.
+        """
+        placeholder_index = next(
+            (i for i, r in enumerate(self.all_analysis_results) if r is placeholder_result),
+            None
+        )
+        if placeholder_index is not None:
+            self.all_analysis_results[placeholder_index] = analysis_result
+        else:
+            self._upsert_analysis_result(analysis_result)
+
+        # Propagate higher-confidence fields from the new result back into older results
+        self._propagate_higher_confidence_to_history(analysis_result.entities, exclude_index=placeholder_index)
+
+        self.screenshots_processed_count += 1
+        logger.info(
+            "AI analysis completed. Total taken: %d, Processed: %d",
+            self.screenshots_taken_count, self.screenshots_processed_count
+        )
+        self._show_status_message("AI analysis completed. Displaying results.", is_error=False)
+        if (self.all_analysis_results
+                and self.all_analysis_results[-1] is analysis_result):
+            # Common case: only the trailing entry changed
+            self._refresh_last_result_in_ui(analysis_result)
+        else:
+            self._update_ui_with_results(update_data=True, error_message=analysis_result.error)
+
+    def _commit_error_result(self, error_result: AnalysisResult,
+                             placeholder_result: Optional[AnalysisResult], error_msg: str):
+        """Record a failed analysis in the history and refresh the UI.
+
+        Runs on the Tk thread (see _commit_analysis_result). With a
+        placeholder the error takes its slot; otherwise it replaces a
+        trailing placeholder or is appended.
+        """
+        if placeholder_result is not None:
+            placeholder_index = next(
+                (i for i, r in enumerate(self.all_analysis_results) if r is placeholder_result),
+                None
+            )
+            if placeholder_index is not None:
+                self.all_analysis_results[placeholder_index] = error_result
+            else:
+                self.all_analysis_results.append(error_result)
+        elif self.all_analysis_results and self.all_analysis_results[-1].summary == "Processing...":
+            self.all_analysis_results[-1] = error_result
+        else:
+            self.all_analysis_results.append(error_result)
+        self._update_ui_with_results(update_data=True, error_message=error_msg)
+
     async def _select_region_async(self):
         """Run region selection on Tk main thread and await result safely."""
         future: asyncio.Future = self.loop.create_future()
 
         def _do_select():
+            # Runs on the Tk main thread; hand the result back to the loop
+            # thread via call_soon_threadsafe (futures are not thread-safe).
             try:
                 coords = self.screenshot_capture.select_region()
                 if not future.done():
-                    future.set_result(coords)
+                    self.loop.call_soon_threadsafe(future.set_result, coords)
             except Exception as e:
                 logger.error(f"Error during region selection: {e}", exc_info=True)
                 if not future.done():
-                    future.set_exception(e)
+                    self.loop.call_soon_threadsafe(future.set_exception, e)
 
         # Schedule on Tk main loop
         self.root.after(0, _do_select)
@@ -340,6 +550,23 @@ class AscendantVisionAIPlatformApp:
     # ------------------------------
     # Results management helpers
     # ------------------------------
+    def _make_result_from_template(self, summary: str, document_id: str, error: Optional[str] = None) -> AnalysisResult:
+        """Clone the cached placeholder instead of rebuilding the result shell.
+        Non-error clones get freshly constructed entities: a shallow copy
+        would share the sentinel's ConfidenceValue instances, so an in-place
+        edit on one clone could contaminate every other clone and the
+        sentinel itself. Error results only carry the message - every
+        consumer (combine, propagation) skips entries with result.error set
+        - so they share the sentinel outright and allocate nothing beyond
+        the result shell.
+        """
+        result = copy.copy(self._PLACEHOLDER_RESULT)
+        result.entities = self._EMPTY_ENTITIES if error else MortgageDocumentEntities()
+        result.summary = summary
+        result.error = error
+        result.document_id = document_id
+        return result
+
     def _upsert_analysis_result(self, new_result: AnalysisResult):
         """Insert or merge result into the list by document_id, keeping highest-confidence values."""
         try:
@@ -532,38 +759,112 @@ class AscendantVisionAIPlatformApp:
         except Exception as e:
             logger.warning(f"Failed to propagate higher-confidence entities to history: {e}")
 
-    def _convert_pil_to_bytes(self, pil_image: Image.Image, dpi : int = 300) -> bytes:
-        byte_arr = BytesIO()
-        pil_image.save(byte_arr, format='PNG', dpi=(dpi, dpi))
-        return byte_arr.getvalue()
+    def _convert_pil_to_bytes(self, pil_image: "Image.Image") -> "BytesIO":
+        from io import BytesIO
+        from PIL import Image
+
+        # Bound the long side at 2048px: the vision model tiles at 768/2048 so
+        # extra detail is discarded server-side anyway, while a smaller input
+        # shrinks encode time and the base64 payload. In-place is fine: the
+        # capture is closed right after encoding.
+        if max(pil_image.size) > 2048:
+            pil_image.thumbnail((2048, 2048), Image.LANCZOS)
+
+        # Colorless scans compress noticeably better as a single luminance
+        # channel, and the model reads them just as well.
+        if pil_image.mode != 'L' and _near_grayscale(pil_image):
+            pil_image = pil_image.convert('L')
+
+        fmt = str(getattr(config, 'IMAGE_FORMAT', 'JPEG')).upper()
+        quality = int(getattr(config, 'IMAGE_JPEG_QUALITY', 85))
+
+        # Rewind and reuse one scratch buffer: captures are serialized, and a
+        # warm buffer keeps its capacity so multi-MB encodes skip the
+        # grow/memcpy cycle a fresh BytesIO pays every time.
+        if self._encode_scratch is None:
+            self._encode_scratch = BytesIO()
+        byte_arr = self._encode_scratch
+        byte_arr.seek(0)
+        byte_arr.truncate()
+
+        if fmt == 'PNG':
+            # Lossless path: compress_level=1 encodes ~10x faster than the
+            # zlib default for only a few percent more bytes.
+            if pil_image.mode in ('RGBA', 'P'):
+                pil_image = pil_image.convert('RGB')
+            pil_image.save(byte_arr, format='PNG', compress_level=1)
+            return byte_arr
+
+        # Prefer libjpeg-turbo (SIMD DCT/Huffman, typically 2-4x faster than
+        # PIL's encoder) when the optional dependency is present. Grayscale
+        # captures skip it and go straight through PIL's 'L'-mode encoder.
+        tj = _get_turbojpeg() if pil_image.mode != 'L' else None
+        if tj is not None:
+            try:
+                import numpy as np
+                from turbojpeg import TJPF_RGB
+                arr = np.asarray(pil_image.convert('RGB'))
+                return BytesIO(tj.encode(arr, quality=quality, pixel_format=TJPF_RGB))
+            except Exception as e:
+                logger.warning(f"turbojpeg encode failed ({e}); falling back to PIL.")
+        # JPEG is several times cheaper to encode than PNG for screen regions
+        # and 3-5x smaller on the wire; the vision API accepts either.
+        if pil_image.mode not in ('RGB', 'L'):
+            pil_image = pil_image.convert('RGB')
+        pil_image.save(byte_arr, format='JPEG', quality=quality, optimize=False, progressive=False)
+        return byte_arr
 
     def _update_ui_with_results(self, update_data: bool, error_message: str = None):
-        self.root.after(0, self._manage_results_window_visibility, True, update_data, error_message)
+        if error_message:
+            self._pending_error_message = error_message
+        self._ui_update_data = self._ui_update_data or update_data
+        if self._ui_dirty:
+            return  # a flush is already queued; it will pick up this state
+        self._ui_dirty = True
+        self._after_idle(self._flush_ui)
+
+    def _flush_ui(self):
+        self._ui_dirty = False
+        update_data = self._ui_update_data
+        self._ui_update_data = False
+        error_message = self._pending_error_message
+        self._pending_error_message = None
+        self._manage_results_window_visibility(True, update_data, error_message)
+
+    def _append_placeholder_in_ui(self, placeholder_result: AnalysisResult):
+        # Runs on the Tk thread so the deque append cannot race a render;
+        # root.after callbacks run in order, so the placeholder is always in
+        # the history before its _commit_* callback looks for it.
+        self.all_analysis_results.append(placeholder_result)
+        self._show_placeholder_in_ui()
+
+    def _show_placeholder_in_ui(self):
+        # The placeholder is already in the shared results list; avoid the full
+        # recombine-and-rebuild that update_data would trigger.
+        if self.results_window and self.results_window.winfo_exists():
+            self.results_window.append_placeholder()
+            self.results_window.deiconify()
+        else:
+            self._manage_results_window_visibility(show=True, update_data=True)
+
+    def _refresh_last_result_in_ui(self, result: AnalysisResult):
+        if self.results_window and self.results_window.winfo_exists():
+            self.results_window.replace_last(result)
+            self.results_window.deiconify()
+        else:
+            self._manage_results_window_visibility(show=True, update_data=True)
 
     def _manage_results_window_visibility(self, show: bool, update_data: bool = False, error_message: str = None):
         current_results = self.all_analysis_results
 
         if error_message and not current_results:
-            current_results = [AnalysisResult(entities=MortgageDocumentEntities(), summary="", error=error_message, document_id="Error_Doc")]
-            logger.warning(f"Displaying results with error: {error_message}")
+            current_results = [self._make_result_from_template(summary="", error=error_message, document_id="Error_Doc")]
+            logger.warning("Displaying results with error: %s", error_message)
         
         if not self.results_window or not self.results_window.winfo_exists():
             if show:
                 logger.info("Creating new ResultsWindow.")
-                self.results_window = ResultsWindow(
-                    self.root,
-                    current_results,
-                    on_new_input_callback=self._trigger_new_capture_for_current_session,
-                    on_close_callback=self._on_results_window_closed
-                )
-                self.results_window._position_window_on_right_half()
-                self.results_window.add_settings_button(self._open_settings_window)
-                self.results_window.set_capture_callbacks(
-                    on_new_capture_callback=self._trigger_new_capture_for_current_session,
-                    on_start_new_session_callback=self._start_new_session_callback
-                )
-                self.status_label = ttk.Label(self.results_window, text="", anchor="w", font=("Helvetica", 10))
-                self.status_label.pack(side=tk.BOTTOM, fill=tk.X, padx=10, pady=5)
+                self.results_window = self._build_results_window(current_results)
                 self.results_window.lift()
                 self.results_window.focus_force()
             else:
@@ -574,9 +875,16 @@ class AscendantVisionAIPlatformApp:
                 logger.info("Updating existing ResultsWindow.")
                 if update_data:
                     self.results_window.update_data(current_results)
-                self.results_window.deiconify()
-                self.results_window.lift()
-                self.results_window.focus_force()
+                # Skip the deiconify/lift/focus round-trips if already in front
+                try:
+                    focused = self.results_window.focus_displayof()
+                    already_front = focused is not None and focused.winfo_toplevel() is self.results_window
+                except Exception:
+                    already_front = False
+                if not already_front:
+                    self.results_window.deiconify()
+                    self.results_window.lift()
+                    self.results_window.focus_force()
             else:
                 self.results_window.withdraw()
 
@@ -586,20 +894,15 @@ class AscendantVisionAIPlatformApp:
             self.results_window.deiconify()
             self.results_window.lift()
             self.results_window.focus_force()
-        
-        self.loop.create_task(self._run_analysis_workflow())
+
+        self._on_hotkey()
 
     def _start_new_session_callback(self):
         logger.info("User requested to start a new session. Clearing all stored results.")
         self.all_analysis_results.clear()
+        self._doc_counter = 0
         self.screenshots_taken_count = 0
         self.screenshots_processed_count = 0
-        self.all_analysis_results.append(AnalysisResult(
-            entities=MortgageDocumentEntities(),
-            summary="",
-            error=None,
-            document_id="Document_0"
-        ))
         self._manage_results_window_visibility(show=True, update_data=True)
         self._show_status_message("New session started. Ready for capture.", is_error=False)
         logger.info("UI refreshed and ready for new input.")
@@ -620,6 +923,7 @@ class AscendantVisionAIPlatformApp:
             existing.focus_force()
             return
         
+        from ui.settings_window import SettingsWindow
         self._settings_dialog = SettingsWindow(self.root, current_settings, self._apply_settings)
         self._settings_dialog.focus_set()
         self._settings_dialog.grab_set()
@@ -629,9 +933,14 @@ class AscendantVisionAIPlatformApp:
         
         if config.OPENAI_API_KEY != new_settings['OPENAI_API_KEY']:
             config.OPENAI_API_KEY = new_settings['OPENAI_API_KEY']
-            logger.info("OpenAI API key changed. Re-initializing AIAnalysisService.")
-            self.loop.create_task(self._init_async_services())
-            self.root.after(500, self._check_api_configs) 
+            if self.ai_analysis_service is not None:
+                # Swap the key on the live client; keeps pooled connections warm
+                logger.info("OpenAI API key changed. Updating AIAnalysisService in place.")
+                self.ai_analysis_service.set_api_key(config.OPENAI_API_KEY)
+                self.root.after(0, self._check_api_configs)
+            else:
+                logger.info("OpenAI API key changed. Initializing AIAnalysisService.")
+                asyncio.run_coroutine_threadsafe(self._init_async_services(), self.loop)
         else:
             logger.info("OpenAI API key did not change.")
 
@@ -666,28 +975,48 @@ class AscendantVisionAIPlatformApp:
         # Refresh the UI to reflect any updated thresholds/configs
         self._update_ui_with_results(update_data=True)
 
+    def _signal_shutdown(self):
+        # Called on the Tk thread; the event lives on the asyncio loop thread.
+        try:
+            self.loop.call_soon_threadsafe(self._shutdown.set)
+        except RuntimeError:
+            # Loop already closed; nothing left to signal.
+            pass
+
     def _on_results_window_closed(self):
         logger.info("Results window closed. Initiating application shutdown.")
-        self.is_shutting_down = True
+        self._signal_shutdown()
         self.root.quit()
 
     def on_app_close(self):
         logger.info("Main application root window closing (via root window close protocol).")
-        self.is_shutting_down = True
+        self._signal_shutdown()
         self.root.quit()
 
     def _show_status_message(self, message: str, is_error: bool = False):
+        # Safe to call from any thread: the asyncio loop and hotkey hook
+        # threads also report status, and Tk widgets may only be touched
+        # from the thread running mainloop, so marshal through root.after.
+        if threading.current_thread() is not threading.main_thread():
+            self.root.after(0, self._show_status_message, message, is_error)
+            return
         if self.status_label and self.status_label.winfo_exists():
             self.status_label.config(text=message, foreground="red" if is_error else "black")
-            logger.info(f"UI Status: {message}")
+            logger.info("UI Status: %s", message)
         else:
-            logger.warning(f"Status label not available to display message: {message}")
+            logger.warning("Status label not available to display message: %s", message)
 
     def run(self):
         self.root.mainloop()
-        logger.info("Tkinter main loop exited. Closing asyncio loop.")
+        logger.info("Tkinter main loop exited. Stopping asyncio loop thread.")
+        if self.loop.is_running():
+            self.loop.call_soon_threadsafe(self.loop.stop)
+        loop_thread = getattr(self, '_loop_thread', None)
+        if loop_thread and loop_thread.is_alive():
+            loop_thread.join(timeout=5)
         if not self.loop.is_closed():
             self.loop.close()
+        self._executor.shutdown(wait=False)
         logger.info("Application shut down.")
 
 if __name__ == "__main__":
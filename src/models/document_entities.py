@@ -1,7 +1,7 @@
 from dataclasses import dataclass, field
 from typing import Optional, List, Dict, Any, Union
 
-@dataclass
+@dataclass(slots=True)
 class ConfidenceValue:
     """
     Represents an extracted value along with its confidence score.
@@ -28,20 +28,20 @@ class ConfidenceValue:
         return hash((str(self.value), self.confidence))
 
 
-@dataclass
+@dataclass(slots=True)
 class Rider:
     Name: ConfidenceValue = field(default_factory=lambda: ConfidenceValue(value="N/A"))
     Present: ConfidenceValue = field(default_factory=lambda: ConfidenceValue(value="No"))
     SignedAttached: ConfidenceValue = field(default_factory=lambda: ConfidenceValue(value="No"))
 
-@dataclass
+@dataclass(slots=True)
 class BorrowerEntry:
     Name: ConfidenceValue = field(default_factory=lambda: ConfidenceValue(value="N/A"))
     Alias: ConfidenceValue = field(default_factory=lambda: ConfidenceValue(value=[]))  # list of aliases or string
     Relationship: ConfidenceValue = field(default_factory=lambda: ConfidenceValue(value="N/A"))
     TenantInformation: ConfidenceValue = field(default_factory=lambda: ConfidenceValue(value="N/A"))
 
-@dataclass
+@dataclass(slots=True)
 class MortgageDocumentEntities:
     DocumentType: ConfidenceValue = field(default_factory=lambda: ConfidenceValue(value="N/A"))
     Borrower: ConfidenceValue = field(default_factory=lambda: ConfidenceValue(value=[]))  # list of BorrowerEntry
@@ -70,7 +70,7 @@ class MortgageDocumentEntities:
     LegalDescriptionPresent: ConfidenceValue = field(default_factory=lambda: ConfidenceValue(value="No"))
     LegalDescriptionDetail: ConfidenceValue = field(default_factory=lambda: ConfidenceValue(value="N/A"))
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisResult:
     entities: MortgageDocumentEntities
     summary: str
@@ -0,0 +1,138 @@
+"""Windows-native screen grabber built on cached GDI resources.
+
+PIL's ImageGrab allocates a compatible bitmap and copies it out with
+GetDIBits on every call. This module instead acquires the screen DC,
+a memory DC and a DIB section once, then serves each capture with a
+single BitBlt into the shared DIB buffer. The DIB is only re-created
+when the requested region size changes.
+"""
+
+import ctypes
+from ctypes import wintypes
+import logging
+
+from PIL import Image
+
+logger = logging.getLogger(__name__)
+
+try:
+    _user32 = ctypes.windll.user32
+    _gdi32 = ctypes.windll.gdi32
+except AttributeError:
+    _user32 = None
+    _gdi32 = None
+
+SRCCOPY = 0x00CC0020
+CAPTUREBLT = 0x40000000
+DIB_RGB_COLORS = 0
+BI_RGB = 0
+
+
+class BITMAPINFOHEADER(ctypes.Structure):
+    _fields_ = [
+        ("biSize", wintypes.DWORD),
+        ("biWidth", wintypes.LONG),
+        ("biHeight", wintypes.LONG),
+        ("biPlanes", wintypes.WORD),
+        ("biBitCount", wintypes.WORD),
+        ("biCompression", wintypes.DWORD),
+        ("biSizeImage", wintypes.DWORD),
+        ("biXPelsPerMeter", wintypes.LONG),
+        ("biYPelsPerMeter", wintypes.LONG),
+        ("biClrUsed", wintypes.DWORD),
+        ("biClrImportant", wintypes.DWORD),
+    ]
+
+
+class BITMAPINFO(ctypes.Structure):
+    _fields_ = [
+        ("bmiHeader", BITMAPINFOHEADER),
+        ("bmiColors", wintypes.DWORD * 3),
+    ]
+
+
+class Grabber:
+    """Reusable BitBlt-based region grabber.
+
+    Device contexts are acquired once at construction; the DIB section is
+    (re)allocated only when the capture size changes, so a steady-state
+    grab costs one BitBlt plus a buffer wrap.
+    """
+
+    def __init__(self):
+        if _gdi32 is None:
+            raise OSError("GDI screen capture is only available on Windows.")
+        self._screen_dc = _user32.GetDC(None)
+        if not self._screen_dc:
+            raise OSError("GetDC failed.")
+        self._mem_dc = _gdi32.CreateCompatibleDC(self._screen_dc)
+        if not self._mem_dc:
+            _user32.ReleaseDC(None, self._screen_dc)
+            raise OSError("CreateCompatibleDC failed.")
+        self._bitmap = None
+        self._stock_bitmap = None
+        self._bits = None
+        self._size = (0, 0)
+
+    def _ensure_dib(self, width: int, height: int):
+        if self._bitmap is not None and self._size == (width, height):
+            return
+        bmi = BITMAPINFO()
+        bmi.bmiHeader.biSize = ctypes.sizeof(BITMAPINFOHEADER)
+        bmi.bmiHeader.biWidth = width
+        bmi.bmiHeader.biHeight = -height  # negative height = top-down rows
+        bmi.bmiHeader.biPlanes = 1
+        bmi.bmiHeader.biBitCount = 32
+        bmi.bmiHeader.biCompression = BI_RGB
+        bits = ctypes.c_void_p()
+        new_bitmap = _gdi32.CreateDIBSection(
+            self._mem_dc, ctypes.byref(bmi), DIB_RGB_COLORS, ctypes.byref(bits), None, 0
+        )
+        if not new_bitmap:
+            raise OSError("CreateDIBSection failed.")
+        # Select the new DIB in before deleting the old one: GDI refuses to
+        # delete a bitmap while it is selected into a DC, so the old order
+        # leaked one DIB section per size change. The first SelectObject
+        # returns the DC's stock bitmap, kept so close() can restore it.
+        prev = _gdi32.SelectObject(self._mem_dc, new_bitmap)
+        if self._stock_bitmap is None:
+            self._stock_bitmap = prev
+        if self._bitmap is not None:
+            _gdi32.DeleteObject(self._bitmap)
+        self._bitmap = new_bitmap
+        self._bits = bits
+        self._size = (width, height)
+
+    def capture(self, x: int, y: int, width: int, height: int) -> Image.Image:
+        self._ensure_dib(width, height)
+        # CAPTUREBLT includes layered (alpha-blended) windows in the copy.
+        ok = _gdi32.BitBlt(
+            self._mem_dc, 0, 0, width, height,
+            self._screen_dc, x, y, SRCCOPY | CAPTUREBLT
+        )
+        if not ok:
+            raise OSError("BitBlt failed.")
+        buf = (ctypes.c_char * (width * height * 4)).from_address(self._bits.value)
+        return Image.frombuffer("RGB", (width, height), buf, "raw", "BGRX", 0, 1)
+
+    def close(self):
+        try:
+            # Deselect the DIB (restore the stock bitmap) before deleting it;
+            # a selected bitmap cannot be deleted.
+            if self._mem_dc and self._stock_bitmap is not None:
+                _gdi32.SelectObject(self._mem_dc, self._stock_bitmap)
+                self._stock_bitmap = None
+            if self._bitmap is not None:
+                _gdi32.DeleteObject(self._bitmap)
+                self._bitmap = None
+            if self._mem_dc:
+                _gdi32.DeleteDC(self._mem_dc)
+                self._mem_dc = None
+            if self._screen_dc:
+                _user32.ReleaseDC(None, self._screen_dc)
+                self._screen_dc = None
+        except Exception as e:
+            logger.debug(f"Error releasing GDI resources: {e}")
+
+    def __del__(self):
+        self.close()
@@ -5,6 +5,119 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# DXGI Desktop Duplication camera (dxcam), probed once on first capture.
+# Duplication copies frames GPU-side and is far faster than GDI BitBlt for
+# repeated grabs; None means dxcam is not installed or failed to init.
+_dxcam_camera = None
+_dxcam_probed = False
+
+def _get_dxcam():
+    global _dxcam_camera, _dxcam_probed
+    if not _dxcam_probed:
+        _dxcam_probed = True
+        try:
+            import dxcam
+            _dxcam_camera = dxcam.create(output_idx=0)
+            logger.info("Using DXGI desktop duplication (dxcam) for screen capture.")
+        except Exception:
+            _dxcam_camera = None
+            logger.debug("dxcam unavailable; falling back to mss/GDI capture.")
+    return _dxcam_camera
+
+# Persistent mss screen-grabber, probed once on first capture. Holding one
+# instance keeps the GDI DC/DIB section (or X11 handles) alive across grabs
+# instead of re-initializing them per call; None means mss is unavailable
+# and PIL's ImageGrab is used instead.
+_mss_instance = None
+_mss_probed = False
+
+def _get_mss():
+    global _mss_instance, _mss_probed
+    if not _mss_probed:
+        _mss_probed = True
+        try:
+            import mss
+            _mss_instance = mss.mss()
+            logger.info("Using mss for screen capture.")
+        except Exception:
+            _mss_instance = None
+            logger.debug("mss unavailable; falling back to PIL ImageGrab.")
+    return _mss_instance
+
+# Native GDI fallback used on Windows when mss is not installed. It caches
+# the device contexts and DIB section across captures, so it avoids the
+# per-call bitmap alloc/copy that ImageGrab performs.
+_gdi_grabber = None
+_gdi_probed = False
+
+def _get_gdi_grabber():
+    global _gdi_grabber, _gdi_probed
+    if not _gdi_probed:
+        _gdi_probed = True
+        try:
+            from services._win_grabber import Grabber
+            _gdi_grabber = Grabber()
+            logger.info("Using native GDI grabber for screen capture.")
+        except Exception:
+            _gdi_grabber = None
+            logger.debug("Native GDI grabber unavailable; falling back to PIL ImageGrab.")
+    return _gdi_grabber
+
+# Region-grab callable bound once on the first capture; crop_image then runs
+# with no per-call backend probing or platform branching. Tiered by expected
+# speed: dxcam (DXGI duplication) -> mss -> native GDI -> PIL ImageGrab.
+_GRAB = None
+
+def _select_backend():
+    def _imagegrab(x1, y1, x2, y2):
+        return ImageGrab.grab(bbox=(x1, y1, x2, y2), all_screens=True)
+
+    sct = _get_mss()
+    grabber = _get_gdi_grabber() if sct is None else None
+    if sct is not None:
+        try:
+            import numpy as np  # optional: vectorized BGRA->RGB reorder
+        except ImportError:
+            np = None
+        if np is not None:
+            def _mss_grab(x1, y1, x2, y2):
+                shot = sct.grab({"left": x1, "top": y1, "width": x2 - x1, "height": y2 - y1})
+                # Reversed channel slice is pointer arithmetic only; the
+                # single copy happens in ascontiguousarray, which beats
+                # PIL's scalar BGRX unpack loop on large regions.
+                arr = np.frombuffer(shot.raw, np.uint8).reshape(shot.height, shot.width, 4)[:, :, 2::-1]
+                return Image.fromarray(np.ascontiguousarray(arr))
+        else:
+            def _mss_grab(x1, y1, x2, y2):
+                shot = sct.grab({"left": x1, "top": y1, "width": x2 - x1, "height": y2 - y1})
+                return Image.frombytes("RGB", shot.size, shot.bgra, "raw", "BGRX")
+        base = _mss_grab
+    elif grabber is not None:
+        def _gdi_grab(x1, y1, x2, y2):
+            return grabber.capture(x1, y1, x2 - x1, y2 - y1)
+        base = _gdi_grab
+    else:
+        base = _imagegrab
+
+    camera = _get_dxcam()
+    if camera is not None:
+        def _dxcam_grab(x1, y1, x2, y2):
+            # grab() returns None when no frame is newer than the last
+            # duplication copy, and raises for regions outside the primary
+            # output (dxcam asserts on its bounds); fall back to the
+            # BitBlt tier in either case.
+            try:
+                frame = camera.grab(region=(x1, y1, x2, y2))
+            except Exception:
+                logger.debug("dxcam grab failed for region (%d, %d, %d, %d); using fallback backend.",
+                             x1, y1, x2, y2)
+                frame = None
+            if frame is not None:
+                return Image.fromarray(frame)
+            return base(x1, y1, x2, y2)
+        return _dxcam_grab
+    return base
+
 class ScreenshotCapture:
     def __init__(self, parent_tk_root: tk.Tk, dpi_scale=1.0):
         self.parent_tk_root = parent_tk_root
@@ -13,6 +126,14 @@ class ScreenshotCapture:
         self.rect_id = None
         self.start_x, self.start_y, self.end_x, self.end_y = 0, 0, 0, 0
         self.selection_made = False
+        # Drag redraws are coalesced to a ~60Hz timer instead of running at
+        # the mouse report rate (up to 1000Hz on gaming mice).
+        self._drag_pending = False
+        self._last_xy = (0, 0)
+        self._after_id = None
+        # Screen origin of the selection overlay, cached once per selection.
+        self._root_x = 0
+        self._root_y = 0
 
     def select_region(self):
         self.selection_window = tk.Toplevel(self.parent_tk_root)
@@ -33,6 +154,12 @@ class ScreenshotCapture:
 
         self.rect_id = self.canvas.create_rectangle(0, 0, 0, 0, outline="red", width=2)
 
+        # The fullscreen overrideredirect overlay never moves once mapped;
+        # resolving its origin here saves two winfo round-trips per redraw.
+        self.selection_window.update_idletasks()
+        self._root_x = self.selection_window.winfo_rootx()
+        self._root_y = self.selection_window.winfo_rooty()
+
         logger.info("Select the area to capture using your mouse (drag and release). Press ESC to cancel...")
 
         self.parent_tk_root.wait_window(self.selection_window)
@@ -41,41 +168,66 @@ class ScreenshotCapture:
             x1, x2 = sorted([self.start_x, self.end_x])
             y1, y2 = sorted([self.start_y, self.end_y])
 
-            logger.info(f"Selected screen region (physical pixels): ({x1}, {y1}) to ({x2}, {y2})")
+            logger.info("Selected screen region (physical pixels): (%d, %d) to (%d, %d)", x1, y1, x2, y2)
             return (x1, y1, x2, y2)
         else:
             logger.info("Screen region selection cancelled.")
             return None
 
     def _on_mouse_press(self, event):
-        self.start_x = self.selection_window.winfo_pointerx()
-        self.start_y = self.selection_window.winfo_pointery()
+        # event.x_root/y_root carry the screen coordinates already; no need
+        # for an extra winfo_pointerx/y round trip.
+        self.start_x = event.x_root
+        self.start_y = event.y_root
         self.selection_made = False
+        self._drag_pending = False
+        if self._after_id is None:
+            self._after_id = self.selection_window.after(16, self._flush_drag)
 
     def _on_mouse_drag(self, event):
-        self.end_x = self.selection_window.winfo_pointerx()
-        self.end_y = self.selection_window.winfo_pointery()
-        if self.start_x is not None and self.start_y is not None:
+        # Only record the latest pointer position; the 60Hz timer redraws.
+        self._last_xy = (event.x_root, event.y_root)
+        self._drag_pending = True
+
+    def _flush_drag(self):
+        self._after_id = None
+        if self.selection_window is None or not self.selection_window.winfo_exists():
+            return
+        if self._drag_pending:
+            self._drag_pending = False
+            self.end_x, self.end_y = self._last_xy
             self.canvas.coords(
                 self.rect_id,
-                self.start_x - self.selection_window.winfo_rootx(),
-                self.start_y - self.selection_window.winfo_rooty(),
-                self.end_x - self.selection_window.winfo_rootx(),
-                self.end_y - self.selection_window.winfo_rooty()
+                self.start_x - self._root_x,
+                self.start_y - self._root_y,
+                self.end_x - self._root_x,
+                self.end_y - self._root_y
             )
+        self._after_id = self.selection_window.after(16, self._flush_drag)
+
+    def _cancel_drag_timer(self):
+        if self._after_id is not None:
+            try:
+                self.selection_window.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
 
     def _on_mouse_release(self, event):
-        self.end_x = self.selection_window.winfo_pointerx()
-        self.end_y = self.selection_window.winfo_pointery()
+        self._cancel_drag_timer()
+        self.end_x = event.x_root
+        self.end_y = event.y_root
         if abs(self.end_x - self.start_x) > 5 and abs(self.end_y - self.start_y) > 5:
             self.selection_made = True
         self.selection_window.destroy()
 
     def _on_escape_key(self, event):
+        self._cancel_drag_timer()
         self.selection_made = False
         self.selection_window.destroy()
 
     def crop_image(self, coordinates):
+        global _GRAB
         if not coordinates or len(coordinates) != 4:
             logger.error("Invalid coordinates provided for cropping.")
             return None
@@ -85,22 +237,12 @@ class ScreenshotCapture:
             logger.warning("Selected region is too small or invalid for cropping.")
             return None
 
-        img_full = None
-        img_cropped = None
-        returned_image = None
         try:
-            img_full = ImageGrab.grab()
-            logger.info(f"Full screen captured. Image dimensions: {img_full.size}")
-
-            img_cropped = img_full.crop((x1, y1, x2, y2))
-            logger.info(f"Image cropped to region: ({x1}, {y1}, {x2}, {y2}). Cropped dimensions: {img_cropped.size}")
-            returned_image = img_cropped
+            if _GRAB is None:
+                _GRAB = _select_backend()
+            img_cropped = _GRAB(x1, y1, x2, y2)
+            logger.info("Captured screen region (%d, %d, %d, %d). Dimensions: %s", x1, y1, x2, y2, img_cropped.size)
             return img_cropped
         except Exception as e:
-            logger.error(f"Error during screen capture or cropping: {e}", exc_info=True)
-            return None
-        finally:
-            if img_full:
-                img_full.close()
-            if img_cropped and img_cropped is not returned_image:
-                img_cropped.close()
\ No newline at end of file
+            logger.error(f"Error during screen capture: {e}", exc_info=True)
+            return None
\ No newline at end of file
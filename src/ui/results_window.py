@@ -4,6 +4,7 @@ import logging
 from typing import Callable, Any, List, Dict, Optional
 from models.document_entities import AnalysisResult, MortgageDocumentEntities, Rider, ConfidenceValue, BorrowerEntry
 from dataclasses import fields
+from operator import attrgetter
 import re
 import difflib
 import config
@@ -11,6 +12,24 @@ from utils.common_utils import get_work_area
 
 logger = logging.getLogger(__name__)
 
+# The entity schema is fixed, so reflect over it exactly once at import:
+# per-repaint fields() calls rebuild Field objects for the same 26 names.
+_ENTITY_FIELD_NAMES = tuple(f.name for f in fields(MortgageDocumentEntities))
+# C-level multi-getter: one call pulls every ConfidenceValue off an entities
+# instance as a tuple, replacing 26 Python-level getattr dispatches per row.
+_ENTITY_VALUES = attrgetter(*_ENTITY_FIELD_NAMES)
+# Fully-resolved display names: dict.get(key, key.replace(...).title()) builds
+# the fallback string on every call even when the key is present, so bake the
+# fallbacks in once and make per-row lookup a plain subscript.
+_DISPLAY_KEYS = {
+    name: config.ENTITY_DISPLAY_NAMES.get(name, name.replace("_", " ").title())
+    for name in _ENTITY_FIELD_NAMES
+}
+_MONEY_FIELDS = tuple(getattr(config, 'MONEY_FIELDS', ("LoanAmount", "RecordingCost")))
+# Rebuilt from the collected legal segments after the merge loop, so the
+# per-field dispatch skips them entirely.
+_SKIP_COMBINE_FIELDS = frozenset({"LegalDescriptionPresent", "LegalDescriptionDetail"})
+
 class ResultsWindow(tk.Toplevel):
     def __init__(self, parent: tk.Tk, all_analysis_results: List[AnalysisResult],
                  on_new_input_callback: Callable[[], None], on_close_callback: Callable[[], None]):
@@ -36,7 +55,25 @@ class ResultsWindow(tk.Toplevel):
         self.on_close_callback = on_close_callback
 
         self.entity_entries: Dict[str, tk.Entry] = {}
-        self.combined_entities: MortgageDocumentEntities = MortgageDocumentEntities() 
+        # Widget pool: one (label, entry, copy button) triple per display key,
+        # created on first use and re-gridded on later renders. Tk widget
+        # construction is expensive; re-gridding an existing row is not.
+        self._field_rows: Dict[str, tuple] = {}
+        self._legal_present_header: Optional[ttk.Label] = None
+        self._legal_present_value_label: Optional[ttk.Label] = None
+        self._legal_detail_header: Optional[ttk.Label] = None
+        self.combined_entities: MortgageDocumentEntities = MortgageDocumentEntities()
+        # Dirty-flag coalescing for update_data: back-to-back updates collapse
+        # into a single render on the next 50ms tick.
+        self._pending_results: Optional[List[AnalysisResult]] = None
+        self._flush_scheduled = False
+        # Identity signature of the last rendered list; lets no-op updates
+        # (e.g. a cancelled capture) skip the repopulate entirely.
+        self._last_update_sig: Optional[tuple] = None
+        # Running legal-description segment history; kept across incremental
+        # merges so concatenation order and dedup match a full recombine.
+        self._legal_segments: List[str] = []
+        self._legal_segments_conf: List[float] = []
         self.legal_description_detail_text_widget: Optional[tk.Text] = None
         self.error_labels: List[ttk.Label] = []
 
@@ -186,13 +223,22 @@ class ResultsWindow(tk.Toplevel):
         return False
 
     def _clear_grid_widgets(self):
-        for widget in self.entities_grid_container.winfo_children():
-            widget.destroy()
+        # Hide pooled rows with grid_remove so they keep their Tk resources
+        # for the next render; only the (few) error labels are destroyed.
+        for label, entry, copy_btn in self._field_rows.values():
+            label.grid_remove()
+            entry.grid_remove()
+            copy_btn.grid_remove()
         self.entity_entries.clear()
         for label in self.error_labels:
             if label.winfo_exists():
                 label.destroy()
         self.error_labels.clear()
+        for widget in (self._legal_present_header, self._legal_present_value_label,
+                       self._legal_detail_header, self.legal_description_detail_text_widget,
+                       getattr(self, 'copy_legal_description_btn', None)):
+            if widget is not None and widget.winfo_exists():
+                widget.grid_remove()
 
     def _get_underlying_value(self, value: Any) -> Any:
         """Helper to get the actual value from a ConfidenceValue object or return the value itself."""
@@ -232,6 +278,56 @@ class ResultsWindow(tk.Toplevel):
             return None
         return canon
 
+    def _collect_legal_segments(self, results: List[AnalysisResult], segments: List[str],
+                                segments_conf: List[float], threshold: float):
+        """Append each result's high-confidence legal-description text to
+        `segments`, deduplicated by normalized text while preserving the
+        original wording."""
+        for res in results:
+            if res.error or not res.entities:
+                continue
+            try:
+                detail_cv: ConfidenceValue = getattr(res.entities, 'LegalDescriptionDetail', ConfidenceValue(value='N/A'))
+                val = self._get_underlying_value(detail_cv)
+                conf = float(getattr(detail_cv, 'confidence', 0.0) or 0.0)
+                if self._is_value_valid(val) and conf >= threshold:
+                    norm = re.sub(r"\s+", " ", str(val)).strip().lower()
+                    if norm and all(re.sub(r"\s+", " ", s).strip().lower() != norm for s in segments):
+                        segments.append(str(val))
+                        segments_conf.append(conf)
+            except Exception:
+                continue
+
+    def _merge_result_into(self, combined: MortgageDocumentEntities,
+                           result: AnalysisResult) -> MortgageDocumentEntities:
+        """Fold one new result into an already-combined view.
+
+        Every combining rule is monotone (confidence-max scalars, keyed
+        unions for borrowers/riders, appended legal segments), so merging
+        the cached view with just the new result matches a full recombine
+        of the underlying list at O(|fields|) instead of O(N * |fields|).
+        """
+        if result.error or not result.entities:
+            return combined
+
+        threshold = float(getattr(config, 'UI_CONFIDENCE_MIN', 0.9) or 0.9)
+        segments = self._legal_segments
+        segments_conf = self._legal_segments_conf
+        self._collect_legal_segments([result], segments, segments_conf, threshold)
+
+        carrier = AnalysisResult(entities=combined, summary="")
+        merged = self._combine_analysis_results([carrier, result])
+
+        # The two-element combine saw only the carrier's concatenated text;
+        # restore the segment history and rebuild the detail from it.
+        self._legal_segments = segments
+        self._legal_segments_conf = segments_conf
+        if segments:
+            conf = max(segments_conf)
+            merged.LegalDescriptionDetail = ConfidenceValue(value="\n\n".join(segments), confidence=conf)
+            merged.LegalDescriptionPresent = ConfidenceValue(value='Yes', confidence=conf)
+        return merged
+
     def _combine_analysis_results(self, all_results: List[AnalysisResult]) -> MortgageDocumentEntities:
         """
         Combines multiple AnalysisResults into a single MortgageDocumentEntities instance,
@@ -251,206 +347,203 @@ class ResultsWindow(tk.Toplevel):
         # Pre-collect Legal Description high-confidence segments to concatenate
         legal_segments: List[str] = []
         legal_segments_conf: List[float] = []
-        for res in all_results:
-            if res.error or not res.entities:
-                continue
-            try:
-                detail_cv: ConfidenceValue = getattr(res.entities, 'LegalDescriptionDetail', ConfidenceValue(value='N/A'))
-                val = self._get_underlying_value(detail_cv)
-                conf = float(getattr(detail_cv, 'confidence', 0.0) or 0.0)
-                if self._is_value_valid(val) and conf >= threshold:
-                    # Deduplicate by normalized text while preserving original text
-                    norm = re.sub(r"\s+", " ", str(val)).strip().lower()
-                    if norm and all(re.sub(r"\s+", " ", s).strip().lower() != norm for s in legal_segments):
-                        legal_segments.append(str(val))
-                        legal_segments_conf.append(conf)
-            except Exception:
+        self._collect_legal_segments(all_results, legal_segments, legal_segments_conf, threshold)
+        # Remember the per-capture segments so incremental merges can extend
+        # them without recombining the whole history.
+        self._legal_segments = legal_segments
+        self._legal_segments_conf = legal_segments_conf
+
+        # Dispatch per field: special-cased list fields go through their
+        # dedicated mergers, everything else through the scalar merger.
+        for field_name in _ENTITY_FIELD_NAMES:
+            if field_name in _SKIP_COMBINE_FIELDS:
+                # Legal description fields are rebuilt from the collected
+                # segments after the loop.
                 continue
+            merger = self._FIELD_MERGERS.get(field_name, ResultsWindow._merge_scalar_field)
+            merger(self, combined_entities, field_name, all_results, threshold)
 
-        # Iterate through each field in MortgageDocumentEntities
-        for field_info in fields(MortgageDocumentEntities):
-            field_name = field_info.name
-            
-            # Special handling for Borrower (list of BorrowerEntry)
-            if field_name == "Borrower":
-                combined_borrowers: Dict[str, BorrowerEntry] = {}
-                combined_conf = 0.0
+        # Post-processing for the legal description fields from the collected
+        # high-confidence segments (concatenated in capture order).
+        if legal_segments:
+            ld_conf = max(legal_segments_conf) if legal_segments_conf else 0.0
+            setattr(combined_entities, 'LegalDescriptionDetail', ConfidenceValue(value="\n\n".join(legal_segments), confidence=ld_conf))
+            setattr(combined_entities, 'LegalDescriptionPresent', ConfidenceValue(value='Yes', confidence=ld_conf))
+        else:
+            setattr(combined_entities, 'LegalDescriptionPresent', ConfidenceValue(value='No', confidence=0.0))
 
-                for result in all_results:
-                    if result.error or not result.entities:
+        return combined_entities
+
+    def _merge_borrower_field(self, combined_entities: MortgageDocumentEntities, field_name: str,
+                              all_results: List[AnalysisResult], threshold: float):
+        """Keyed union of BorrowerEntry lists (list of BorrowerEntry)."""
+        combined_borrowers: Dict[str, BorrowerEntry] = {}
+        combined_conf = 0.0
+
+        for result in all_results:
+            if result.error or not result.entities:
+                continue
+            current_cv: ConfidenceValue = getattr(result.entities, field_name, ConfidenceValue(value=[]))
+            if isinstance(current_cv.value, list):
+                for b in current_cv.value:
+                    if not isinstance(b, BorrowerEntry):
                         continue
-                    current_cv: ConfidenceValue = getattr(result.entities, field_name, ConfidenceValue(value=[]))
-                    if isinstance(current_cv.value, list):
-                        for b in current_cv.value:
-                            if not isinstance(b, BorrowerEntry):
-                                continue
-                            name_val = self._get_underlying_value(b.Name)
-                            if not self._is_value_valid(name_val):
-                                continue
-                            # Enforce high-confidence for borrower Name
-                            try:
-                                name_conf_val = float(self._get_underlying_value(b.Name.confidence) or 0.0)
-                            except Exception:
-                                name_conf_val = 0.0
-                            if name_conf_val < threshold:
-                                continue
-                            key = self._normalize_string_for_comparison(name_val)
-                            if not key:
-                                continue
-                            if key not in combined_borrowers or self._get_underlying_value(b.Name.confidence) > self._get_underlying_value(combined_borrowers[key].Name.confidence):
-                                # When adopting a borrower, clear low-confidence subfields
-                                try:
-                                    a_conf = float(self._get_underlying_value(b.Alias.confidence) or 0.0)
-                                    if a_conf < threshold:
-                                        b.Alias.value = []
-                                        b.Alias.confidence = a_conf
-                                except Exception:
-                                    pass
-                                try:
-                                    r_conf = float(self._get_underlying_value(b.Relationship.confidence) or 0.0)
-                                    if r_conf < threshold:
-                                        b.Relationship.value = "N/A"
-                                        b.Relationship.confidence = r_conf
-                                except Exception:
-                                    pass
-                                try:
-                                    t_conf = float(self._get_underlying_value(b.TenantInformation.confidence) or 0.0)
-                                    if t_conf < threshold:
-                                        b.TenantInformation.value = "N/A"
-                                        b.TenantInformation.confidence = t_conf
-                                except Exception:
-                                    pass
-                                combined_borrowers[key] = b
-                            else:
-                                existing = combined_borrowers[key]
-                                # Merge alias lists (only when new alias list is high-confidence)
-                                try:
-                                    a1 = existing.Alias.value if isinstance(existing.Alias.value, list) else []
-                                    a2 = b.Alias.value if isinstance(b.Alias.value, list) else []
-                                    union = list(dict.fromkeys([str(x).strip() for x in a1 + a2 if str(x).strip()]))
-                                    b_alias_conf = float(self._get_underlying_value(b.Alias.confidence) or 0.0)
-                                    if b_alias_conf >= threshold:
-                                        existing.Alias.value = union
-                                        existing.Alias.confidence = max(self._get_underlying_value(existing.Alias.confidence), b_alias_conf)
-                                except Exception:
-                                    pass
-                                # Relationship/Tenant information keep higher confidence (only if new meets threshold)
-                                try:
-                                    b_rel_conf = float(self._get_underlying_value(b.Relationship.confidence) or 0.0)
-                                    if b_rel_conf >= threshold and b_rel_conf > self._get_underlying_value(existing.Relationship.confidence):
-                                        existing.Relationship = b.Relationship
-                                except Exception:
-                                    pass
-                                try:
-                                    b_ten_conf = float(self._get_underlying_value(b.TenantInformation.confidence) or 0.0)
-                                    if b_ten_conf >= threshold and b_ten_conf > self._get_underlying_value(existing.TenantInformation.confidence):
-                                        existing.TenantInformation = b.TenantInformation
-                                except Exception:
-                                    pass
-                    if current_cv.confidence > combined_conf:
-                        combined_conf = current_cv.confidence
+                    name_val = self._get_underlying_value(b.Name)
+                    if not self._is_value_valid(name_val):
+                        continue
+                    # Enforce high-confidence for borrower Name
+                    try:
+                        name_conf_val = float(self._get_underlying_value(b.Name.confidence) or 0.0)
+                    except Exception:
+                        name_conf_val = 0.0
+                    if name_conf_val < threshold:
+                        continue
+                    key = self._normalize_string_for_comparison(name_val)
+                    if not key:
+                        continue
+                    if key not in combined_borrowers or self._get_underlying_value(b.Name.confidence) > self._get_underlying_value(combined_borrowers[key].Name.confidence):
+                        # When adopting a borrower, clear low-confidence subfields
+                        try:
+                            a_conf = float(self._get_underlying_value(b.Alias.confidence) or 0.0)
+                            if a_conf < threshold:
+                                b.Alias.value = []
+                                b.Alias.confidence = a_conf
+                        except Exception:
+                            pass
+                        try:
+                            r_conf = float(self._get_underlying_value(b.Relationship.confidence) or 0.0)
+                            if r_conf < threshold:
+                                b.Relationship.value = "N/A"
+                                b.Relationship.confidence = r_conf
+                        except Exception:
+                            pass
+                        try:
+                            t_conf = float(self._get_underlying_value(b.TenantInformation.confidence) or 0.0)
+                            if t_conf < threshold:
+                                b.TenantInformation.value = "N/A"
+                                b.TenantInformation.confidence = t_conf
+                        except Exception:
+                            pass
+                        combined_borrowers[key] = b
+                    else:
+                        existing = combined_borrowers[key]
+                        # Merge alias lists (only when new alias list is high-confidence)
+                        try:
+                            a1 = existing.Alias.value if isinstance(existing.Alias.value, list) else []
+                            a2 = b.Alias.value if isinstance(b.Alias.value, list) else []
+                            union = list(dict.fromkeys([str(x).strip() for x in a1 + a2 if str(x).strip()]))
+                            b_alias_conf = float(self._get_underlying_value(b.Alias.confidence) or 0.0)
+                            if b_alias_conf >= threshold:
+                                existing.Alias.value = union
+                                existing.Alias.confidence = max(self._get_underlying_value(existing.Alias.confidence), b_alias_conf)
+                        except Exception:
+                            pass
+                        # Relationship/Tenant information keep higher confidence (only if new meets threshold)
+                        try:
+                            b_rel_conf = float(self._get_underlying_value(b.Relationship.confidence) or 0.0)
+                            if b_rel_conf >= threshold and b_rel_conf > self._get_underlying_value(existing.Relationship.confidence):
+                                existing.Relationship = b.Relationship
+                        except Exception:
+                            pass
+                        try:
+                            b_ten_conf = float(self._get_underlying_value(b.TenantInformation.confidence) or 0.0)
+                            if b_ten_conf >= threshold and b_ten_conf > self._get_underlying_value(existing.TenantInformation.confidence):
+                                existing.TenantInformation = b.TenantInformation
+                        except Exception:
+                            pass
+            if current_cv.confidence > combined_conf:
+                combined_conf = current_cv.confidence
 
-                if combined_borrowers:
-                    sorted_vals = [combined_borrowers[k] for k in sorted(combined_borrowers.keys())]
-                    setattr(combined_entities, field_name, ConfidenceValue(value=sorted_vals, confidence=combined_conf))
+        if combined_borrowers:
+            sorted_vals = [combined_borrowers[k] for k in sorted(combined_borrowers.keys())]
+            setattr(combined_entities, field_name, ConfidenceValue(value=sorted_vals, confidence=combined_conf))
 
-            # Special handling for RidersPresent (list of Rider objects)
-            elif field_name == "RidersPresent":
-                combined_riders: Dict[str, Rider] = {} # key: canonical rider name
-                combined_riders_confidence = 0.0 # Confidence for the list as a whole
+    def _merge_rider_field(self, combined_entities: MortgageDocumentEntities, field_name: str,
+                           all_results: List[AnalysisResult], threshold: float):
+        """Dedupe signed, allowlisted riders by canonical name (list of Rider)."""
+        combined_riders: Dict[str, Rider] = {}  # key: canonical rider name
+        combined_riders_confidence = 0.0  # Confidence for the list as a whole
 
-                for result in all_results:
-                    if result.error or not result.entities:
-                        continue
-                    current_cv: ConfidenceValue = getattr(result.entities, field_name, ConfidenceValue(value=[]))
-                    if isinstance(current_cv.value, list): # current_cv.value is expected to be list of Rider objects
-                        for rider_obj in current_cv.value:
-                            # Include only riders that are signed (SignedAttached == "Yes") per business rule
-                            is_signed = False
-                            try:
-                                signed_val = self._get_underlying_value(rider_obj.SignedAttached)
-                                is_signed = isinstance(signed_val, str) and signed_val.strip().lower() == "yes"
-                            except Exception:
-                                is_signed = False
+        for result in all_results:
+            if result.error or not result.entities:
+                continue
+            current_cv: ConfidenceValue = getattr(result.entities, field_name, ConfidenceValue(value=[]))
+            if isinstance(current_cv.value, list): # current_cv.value is expected to be list of Rider objects
+                for rider_obj in current_cv.value:
+                    # Include only riders that are signed (SignedAttached == "Yes") per business rule
+                    is_signed = False
+                    try:
+                        signed_val = self._get_underlying_value(rider_obj.SignedAttached)
+                        is_signed = isinstance(signed_val, str) and signed_val.strip().lower() == "yes"
+                    except Exception:
+                        is_signed = False
 
-                            # Enforce high confidence on rider Name
-                            name_conf_val = 0.0
-                            try:
-                                name_conf_val = float(self._get_underlying_value(rider_obj.Name.confidence) or 0.0)
-                            except Exception:
-                                name_conf_val = 0.0
-
-                            if is_signed and name_conf_val >= threshold and isinstance(rider_obj, Rider) and self._is_value_valid(rider_obj.Name.value):
-                                raw_name = self._get_underlying_value(rider_obj.Name)
-                                canon_name = self._canonicalize_rider_name(raw_name)
-                                if not canon_name or canon_name not in config.RIDER_ALLOWLIST:
-                                    continue  # guardrail: skip unknown/ambiguous riders
-                                candidate = Rider(
-                                    Name=ConfidenceValue(value=canon_name, confidence=self._get_underlying_value(rider_obj.Name.confidence)),
-                                    Present=rider_obj.Present,
-                                    SignedAttached=rider_obj.SignedAttached,
-                                )
-                                if canon_name not in combined_riders or \
-                                   self._get_underlying_value(candidate.Name.confidence) > self._get_underlying_value(combined_riders[canon_name].Name.confidence):
-                                    combined_riders[canon_name] = candidate
+                    # Enforce high confidence on rider Name
+                    name_conf_val = 0.0
+                    try:
+                        name_conf_val = float(self._get_underlying_value(rider_obj.Name.confidence) or 0.0)
+                    except Exception:
+                        name_conf_val = 0.0
+
+                    if is_signed and name_conf_val >= threshold and isinstance(rider_obj, Rider) and self._is_value_valid(rider_obj.Name.value):
+                        raw_name = self._get_underlying_value(rider_obj.Name)
+                        canon_name = self._canonicalize_rider_name(raw_name)
+                        if not canon_name or canon_name not in config.RIDER_ALLOWLIST:
+                            continue  # guardrail: skip unknown/ambiguous riders
+                        candidate = Rider(
+                            Name=ConfidenceValue(value=canon_name, confidence=self._get_underlying_value(rider_obj.Name.confidence)),
+                            Present=rider_obj.Present,
+                            SignedAttached=rider_obj.SignedAttached,
+                        )
+                        if canon_name not in combined_riders or \
+                           self._get_underlying_value(candidate.Name.confidence) > self._get_underlying_value(combined_riders[canon_name].Name.confidence):
+                            combined_riders[canon_name] = candidate
                         
-                        if current_cv.confidence > combined_riders_confidence:
-                            combined_riders_confidence = current_cv.confidence
+                if current_cv.confidence > combined_riders_confidence:
+                    combined_riders_confidence = current_cv.confidence
                 
-                if combined_riders:
-                    sorted_riders = [combined_riders[k] for k in sorted(combined_riders.keys())]
-                    setattr(combined_entities, field_name, ConfidenceValue(value=sorted_riders, confidence=combined_riders_confidence))
-
-            # Special handling for Legal Description: assign concatenated high-confidence segments
-            elif field_name == "LegalDescriptionDetail":
-                if legal_segments:
-                    concatenated = "\n\n".join(legal_segments)
-                    combined_conf = max(legal_segments_conf) if legal_segments_conf else 0.0
-                    setattr(combined_entities, 'LegalDescriptionDetail', ConfidenceValue(value=concatenated, confidence=combined_conf))
-                continue
-            elif field_name == "LegalDescriptionPresent":
-                # Skip direct combine here; handled after we decide detail
-                continue
+        if combined_riders:
+            sorted_riders = [combined_riders[k] for k in sorted(combined_riders.keys())]
+            setattr(combined_entities, field_name, ConfidenceValue(value=sorted_riders, confidence=combined_riders_confidence))
 
-            # General handling for all other ConfidenceValue fields
-            else:
-                best_value: ConfidenceValue = getattr(combined_entities, field_name)
+
+    def _merge_scalar_field(self, combined_entities: MortgageDocumentEntities, field_name: str,
+                            all_results: List[AnalysisResult], threshold: float):
+        """Default merger: adopt the highest-confidence valid value."""
+        best_value: ConfidenceValue = getattr(combined_entities, field_name)
                 
-                for result in all_results:
-                    if result.error or not result.entities:
-                        continue
+        for result in all_results:
+            if result.error or not result.entities:
+                continue
                     
-                    current_cv: ConfidenceValue = getattr(result.entities, field_name, ConfidenceValue())
+            current_cv: ConfidenceValue = getattr(result.entities, field_name, ConfidenceValue())
 
-                    # Only consider updates that meet the high-confidence threshold
-                    try:
-                        conf_val = float(getattr(current_cv, 'confidence', 0.0) or 0.0)
-                    except Exception:
-                        conf_val = 0.0
-
-                    if not self._is_value_valid(current_cv.value) or conf_val < threshold:
-                        continue
+            # Only consider updates that meet the high-confidence threshold
+            try:
+                conf_val = float(getattr(current_cv, 'confidence', 0.0) or 0.0)
+            except Exception:
+                conf_val = 0.0
 
-                    # Prioritize valid values with higher confidence (both meeting threshold)
-                    if (not self._is_value_valid(best_value.value)) or conf_val > float(getattr(best_value, 'confidence', 0.0) or 0.0):
-                        best_value = current_cv
+            if not self._is_value_valid(current_cv.value) or conf_val < threshold:
+                continue
 
-                # Only set if best_value meets threshold and is valid; else leave default (N/A)
-                try:
-                    best_conf = float(getattr(best_value, 'confidence', 0.0) or 0.0)
-                except Exception:
-                    best_conf = 0.0
-                if self._is_value_valid(best_value.value) and best_conf >= threshold:
-                    setattr(combined_entities, field_name, best_value)
+            # Prioritize valid values with higher confidence (both meeting threshold)
+            if (not self._is_value_valid(best_value.value)) or conf_val > float(getattr(best_value, 'confidence', 0.0) or 0.0):
+                best_value = current_cv
 
-        # Post-processing for LegalDescriptionPresent based on LegalDescriptionDetail (high-confidence only)
-        if legal_segments:
-            ld_conf = max(legal_segments_conf) if legal_segments_conf else 0.0
-            setattr(combined_entities, 'LegalDescriptionPresent', ConfidenceValue(value='Yes', confidence=ld_conf))
-        else:
-            setattr(combined_entities, 'LegalDescriptionPresent', ConfidenceValue(value='No', confidence=0.0))
+        # Only set if best_value meets threshold and is valid; else leave default (N/A)
+        try:
+            best_conf = float(getattr(best_value, 'confidence', 0.0) or 0.0)
+        except Exception:
+            best_conf = 0.0
+        if self._is_value_valid(best_value.value) and best_conf >= threshold:
+            setattr(combined_entities, field_name, best_value)
 
-        return combined_entities
+    # Field name -> merge routine; every other field takes the scalar path.
+    _FIELD_MERGERS = {
+        "Borrower": _merge_borrower_field,
+        "RidersPresent": _merge_rider_field,
+    }
 
 
     def _display_entity_fields(self, entities_to_display: MortgageDocumentEntities):
@@ -458,10 +551,8 @@ class ResultsWindow(tk.Toplevel):
         current_col_pair = 0
 
         all_display_fields = []
-        for field_info in fields(MortgageDocumentEntities):
-            field_name = field_info.name
+        for field_name, cv in zip(_ENTITY_FIELD_NAMES, _ENTITY_VALUES(entities_to_display)):
             if field_name not in ["LegalDescriptionPresent", "LegalDescriptionDetail"]:
-                cv: ConfidenceValue = getattr(entities_to_display, field_name)
                 # RidersPresent: only include if at least one rider is signed and the rider name meets confidence threshold
                 if field_name == "RidersPresent":
                     signed_count = 0
@@ -479,7 +570,9 @@ class ResultsWindow(tk.Toplevel):
                     # Fallback detection: if no canonical riders made it into the combined view,
                     # check raw results for any signed, high-confidence riders that are unclassified.
                     fallback_unclassified_signed = 0
-                    if signed_count == 0 and isinstance(self.all_analysis_results, list):
+                    # No type check here: the history may be a list or the
+                    # bounded deque main passes in; any iterable of results works.
+                    if signed_count == 0 and self.all_analysis_results:
                         try:
                             for res in self.all_analysis_results:
                                 if getattr(res, 'error', None) or not getattr(res, 'entities', None):
@@ -642,13 +735,12 @@ class ResultsWindow(tk.Toplevel):
             else: 
                 value_str = self._get_underlying_value(cv_value) # Use helper here
 
-            money_fields = tuple(getattr(config, 'MONEY_FIELDS', ["LoanAmount", "RecordingCost"]))
-            if key in money_fields:
+            if key in _MONEY_FIELDS:
                 norm = self._format_currency_str(value_str)
                 if norm is not None:
                     value_str = norm
-            
-            display_key = config.ENTITY_DISPLAY_NAMES.get(key, key.replace("_", " ").title())
+
+            display_key = _DISPLAY_KEYS.get(key, key)
             
             if self._is_value_valid(value_str): # Confidence already enforced above
                 grid_column_start = current_col_pair * 3
@@ -692,14 +784,21 @@ class ResultsWindow(tk.Toplevel):
         if (float(legal_present_cv.confidence or 0.0) >= config.UI_CONFIDENCE_MIN) or (float(legal_detail_cv.confidence or 0.0) >= config.UI_CONFIDENCE_MIN):
             # LegalDescriptionPresent
             if float(legal_present_cv.confidence or 0.0) >= config.UI_CONFIDENCE_MIN:
-                ttk.Label(self.entities_grid_container, text=f"{config.ENTITY_DISPLAY_NAMES.get('LegalDescriptionPresent', 'Legal Description Present')}:", font=("Arial", 9, "bold")).grid(row=current_row, column=0, sticky="nw", pady=(10, 0), padx=5, columnspan=2)
+                if self._legal_present_header is None or not self._legal_present_header.winfo_exists():
+                    self._legal_present_header = ttk.Label(self.entities_grid_container, text=f"{config.ENTITY_DISPLAY_NAMES.get('LegalDescriptionPresent', 'Legal Description Present')}:", font=("Arial", 9, "bold"))
+                self._legal_present_header.grid(row=current_row, column=0, sticky="nw", pady=(10, 0), padx=5, columnspan=2)
                 current_row += 1
-                ttk.Label(self.entities_grid_container, text=legal_present_value, font=("Arial", 9), wraplength=self.winfo_width() - 40, justify="left").grid(row=current_row, column=0, sticky="nw", pady=(2, 10), padx=5, columnspan=6)
+                if self._legal_present_value_label is None or not self._legal_present_value_label.winfo_exists():
+                    self._legal_present_value_label = ttk.Label(self.entities_grid_container, font=("Arial", 9), justify="left")
+                self._legal_present_value_label.configure(text=legal_present_value, wraplength=self.winfo_width() - 40)
+                self._legal_present_value_label.grid(row=current_row, column=0, sticky="nw", pady=(2, 10), padx=5, columnspan=6)
                 current_row += 1
 
             # LegalDescriptionDetail
             if float(legal_detail_cv.confidence or 0.0) >= config.UI_CONFIDENCE_MIN:
-                ttk.Label(self.entities_grid_container, text=f"{config.ENTITY_DISPLAY_NAMES.get('LegalDescriptionDetail', 'Legal Description Detail')}:", font=("Arial", 9, "bold")).grid(row=current_row, column=0, sticky="nw", pady=(10, 0), padx=5, columnspan=2)
+                if self._legal_detail_header is None or not self._legal_detail_header.winfo_exists():
+                    self._legal_detail_header = ttk.Label(self.entities_grid_container, text=f"{config.ENTITY_DISPLAY_NAMES.get('LegalDescriptionDetail', 'Legal Description Detail')}:", font=("Arial", 9, "bold"))
+                self._legal_detail_header.grid(row=current_row, column=0, sticky="nw", pady=(10, 0), padx=5, columnspan=2)
                 current_row += 1
                 
                 if not self.legal_description_detail_text_widget or not self.legal_description_detail_text_widget.winfo_exists():
@@ -720,43 +819,123 @@ class ResultsWindow(tk.Toplevel):
 
     def _populate_content(self, all_analysis_results: List[AnalysisResult]):
         self.all_analysis_results = all_analysis_results
-        self._clear_grid_widgets()
 
         logger.info(f"ResultsWindow: Populating content with {len(all_analysis_results)} analysis results.")
 
         self.combined_entities = self._combine_analysis_results(all_analysis_results)
+        self._render_content()
 
+    def _render_content(self):
+        """Rebuild the widget grid from the already-combined entities."""
+        self._clear_grid_widgets()
         current_row = self._display_entity_fields(self.combined_entities)
-        current_row = self._display_error_messages(current_row, all_analysis_results)
+        current_row = self._display_error_messages(current_row, self.all_analysis_results)
         current_row = self._display_legal_description_section(current_row)
 
+        self._last_update_sig = self._update_signature(self.all_analysis_results)
         self.update_idletasks()
 
+    @staticmethod
+    def _update_signature(results: List[AnalysisResult]) -> tuple:
+        threshold = float(getattr(config, 'UI_CONFIDENCE_MIN', 0.9) or 0.9)
+        return (threshold,) + tuple(map(id, results))
+
     def update_data(self, new_all_analysis_results: List[AnalysisResult]):
+        # Coalesce: only remember the newest list and render once per tick,
+        # so a burst of completed documents costs a single repopulate.
         logger.info("ResultsWindow: Updating data with new analysis result list.")
-        self._populate_content(new_all_analysis_results)
+        # Per-entry identity tuple plus the active confidence threshold:
+        # replacements anywhere in the list change it, and so does a settings
+        # update that re-filters the same results, while a list that has not
+        # changed since the last render matches.
+        sig = self._update_signature(new_all_analysis_results)
+        if sig == self._last_update_sig and not self._flush_scheduled:
+            self.lift()
+            self.focus_force()
+            return
+        self._pending_results = new_all_analysis_results
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.after(50, self._flush_update)
+
+    def _flush_update(self):
+        self._flush_scheduled = False
+        pending = self._pending_results
+        self._pending_results = None
+        if pending is None or not self.winfo_exists():
+            return
+        self._populate_content(pending)
+        self.lift()
+        self.focus_force()
+
+    def append_placeholder(self, result: Optional[AnalysisResult] = None):
+        """Register a trailing placeholder without re-rendering the grid.
+
+        A placeholder carries empty entities, so recombining every stored
+        result and rebuilding all widgets would produce an identical view;
+        just make sure the entry is in the list and surface the window.
+        """
+        if result is not None and (not self.all_analysis_results or self.all_analysis_results[-1] is not result):
+            self.all_analysis_results.append(result)
+        self.lift()
+        self.focus_force()
+
+    def replace_last(self, result: AnalysisResult):
+        """Replace the trailing (placeholder) entry and re-render once."""
+        prev = self.all_analysis_results[-1] if self.all_analysis_results else None
+        if prev is result:
+            # The caller already swapped its placeholder out of the shared
+            # history before this callback reached the Tk thread, so the
+            # trailing entry is the new result itself. The entry it
+            # displaced was an empty placeholder, making the incremental
+            # merge below just as valid as if we had done the swap here.
+            was_placeholder = True
+        else:
+            was_placeholder = prev is not None and prev.summary == "Processing..." and not prev.error
+            if self.all_analysis_results:
+                self.all_analysis_results[-1] = result
+            else:
+                self.all_analysis_results.append(result)
+        if was_placeholder:
+            # The replaced entry was an empty placeholder that contributed
+            # nothing to the combined view, so folding in just the new
+            # result is equivalent to recombining the whole history.
+            self.combined_entities = self._merge_result_into(self.combined_entities, result)
+            self._render_content()
+        else:
+            self._populate_content(self.all_analysis_results)
         self.lift()
         self.focus_force()
-        self.update()
 
     def _add_entity_editable_field(self, parent_frame: ttk.Frame, row: int, col_start: int, key: str, value: str):
-        label = ttk.Label(parent_frame, text=f"{key}:", font=("Arial", 9, "bold"))
-        label.grid(row=row, column=col_start, sticky="w", padx=(10, 2), pady=3)
+        row_widgets = self._field_rows.get(key)
+        if row_widgets is None:
+            label = ttk.Label(parent_frame, text=f"{key}:", font=("Arial", 9, "bold"))
+            entry = ttk.Entry(parent_frame, width=30)
+            # Use a simple, widely-supported label for the copy button; the
+            # command reads the entry live, so it never needs rebinding.
+            copy_btn = ttk.Button(parent_frame, text="📋", width=4)
+            copy_btn.config(command=lambda entry_widget=entry, btn=copy_btn: self._copy_to_clipboard(entry_widget.get(), btn=btn))
+            self._field_rows[key] = (label, entry, copy_btn)
+        else:
+            label, entry, copy_btn = row_widgets
+            entry.delete(0, tk.END)
 
-        entry = ttk.Entry(parent_frame, width=30)
         entry.insert(0, value)
+        label.grid(row=row, column=col_start, sticky="w", padx=(10, 2), pady=3)
         entry.grid(row=row, column=col_start + 1, sticky="ew", padx=(0, 2), pady=3)
-        self.entity_entries[key] = entry
-
-        # Use a simple, widely-supported label for the copy button
-        copy_btn = ttk.Button(parent_frame, text="📋", width=4)
-        # Bind command after creation so we can reference the button itself
-        copy_btn.config(command=lambda entry_widget=entry, btn=copy_btn: self._copy_to_clipboard(entry_widget.get(), btn=btn))
         copy_btn.grid(row=row, column=col_start + 2, sticky="w", padx=(0, 10), pady=3)
+        self.entity_entries[key] = entry
 
     def _save_edits_to_global_entities(self):
         logger.info("Saving edited entity values back to global results.")
-        latest_result = self.all_analysis_results[-1] if self.all_analysis_results else None
+        # Walk back past error entries: their entities are the shared
+        # empty-entities sentinel (never read by any consumer), so writing
+        # edits into one would leak into every other error result.
+        latest_result = next(
+            (r for r in reversed(self.all_analysis_results) if not r.error),
+            None
+        )
         if not latest_result or not latest_result.entities:
             messagebox.showwarning("No Data", "No analysis result to save edits to.")
             return
@@ -772,38 +951,43 @@ class ResultsWindow(tk.Toplevel):
             
             # Retrieve the existing ConfidenceValue object for this field
             current_cv: ConfidenceValue = getattr(latest_result.entities, original_key, ConfidenceValue())
-            
-            money_fields = tuple(getattr(config, 'MONEY_FIELDS', ["LoanAmount", "RecordingCost"]))
-            if original_key in money_fields:
+            new_value = None
+
+            if original_key in _MONEY_FIELDS:
                 norm = self._format_currency_str(new_value_str)
-                current_cv.value = norm if norm is not None else new_value_str
+                new_value = norm if norm is not None else new_value_str
             elif original_key == "Borrower":
                 logger.warning(f"Editing complex field '{original_key}' as plain text. Saving raw string to ConfidenceValue.value.")
-                current_cv.value = new_value_str
+                new_value = new_value_str
             elif original_key == "RidersPresent":
                 logger.warning(f"Editing of complex field '{original_key}' as a plain string in UI. Value saved as-is in ConfidenceValue.value: {new_value_str}")
-                current_cv.value = new_value_str 
+                new_value = new_value_str
             elif hasattr(latest_result.entities, original_key):
-                current_cv.value = new_value_str
+                new_value = new_value_str
             else:
                 logger.debug(f"Unknown entity key '{original_key}' - cannot update model attribute.")
-            
-            # Set the updated ConfidenceValue back to the entity
-            setattr(latest_result.entities, original_key, current_cv)
+                continue
+
+            # Replace rather than mutate: ConfidenceValue instances can be
+            # shared across results (e.g. adopted by the combined view), so
+            # editing .value in place would rewrite history elsewhere.
+            setattr(latest_result.entities, original_key,
+                    ConfidenceValue(value=new_value, confidence=current_cv.confidence))
         
         if self.legal_description_detail_text_widget and self.legal_description_detail_text_widget.winfo_exists():
             legal_desc_detail_text = self.legal_description_detail_text_widget.get(1.0, tk.END).strip()
             
             legal_detail_cv: ConfidenceValue = latest_result.entities.LegalDescriptionDetail
-            legal_detail_cv.value = legal_desc_detail_text
-            setattr(latest_result.entities, 'LegalDescriptionDetail', legal_detail_cv)
+            setattr(latest_result.entities, 'LegalDescriptionDetail',
+                    ConfidenceValue(value=legal_desc_detail_text, confidence=legal_detail_cv.confidence))
 
             legal_present_cv: ConfidenceValue = latest_result.entities.LegalDescriptionPresent
             if legal_desc_detail_text and legal_desc_detail_text != "N/A" and legal_desc_detail_text != "legal description is missing":
-                legal_present_cv.value = "Yes"
+                legal_present_value = "Yes"
             else:
-                legal_present_cv.value = "No"
-            setattr(latest_result.entities, 'LegalDescriptionPresent', legal_present_cv)
+                legal_present_value = "No"
+            setattr(latest_result.entities, 'LegalDescriptionPresent',
+                    ConfidenceValue(value=legal_present_value, confidence=legal_present_cv.confidence))
 
         # Provide subtle, inline confirmation instead of a popup
         try:
@@ -2,10 +2,20 @@ import sys
 import os
 import ctypes
 from ctypes import wintypes
+from functools import lru_cache
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Resolve Win32 DLL handles once; every ctypes.windll.user32.X access walks
+# the WinDLL attribute cache otherwise. None on non-Windows platforms.
+try:
+    _user32 = ctypes.windll.user32
+    _shcore = ctypes.windll.shcore
+except AttributeError:
+    _user32 = None
+    _shcore = None
+
 def get_base_path() -> str:
     if getattr(sys, 'frozen', False):
         base_path = os.path.dirname(sys.executable)
@@ -16,9 +26,10 @@ def get_base_path() -> str:
         logger.debug(f"Running as script. Base path: {base_path}")
     return base_path
 
+@lru_cache(maxsize=1)
 def get_dpi_scale_factor() -> float:
     try:
-        return ctypes.windll.shcore.GetScaleFactorForDevice(0) / 100.0
+        return _shcore.GetScaleFactorForDevice(0) / 100.0
     except (AttributeError, OSError):
         logger.warning("Could not retrieve system DPI scale factor. Defaulting to 1.0. "
                        "Screen capture accuracy might be affected on high-DPI displays.")
@@ -60,7 +71,7 @@ def get_work_area() -> tuple:
     try:
         SPI_GETWORKAREA = 0x0030
         rect = wintypes.RECT()
-        ok = ctypes.windll.user32.SystemParametersInfoW(SPI_GETWORKAREA, 0, ctypes.byref(rect), 0)
+        ok = _user32.SystemParametersInfoW(SPI_GETWORKAREA, 0, ctypes.byref(rect), 0)
         if ok:
             return (rect.left, rect.top, rect.right, rect.bottom)
     except Exception as e:
@@ -69,8 +80,8 @@ def get_work_area() -> tuple:
         # Fallback to full screen size
         SM_CXSCREEN = 0
         SM_CYSCREEN = 1
-        width = ctypes.windll.user32.GetSystemMetrics(SM_CXSCREEN)
-        height = ctypes.windll.user32.GetSystemMetrics(SM_CYSCREEN)
+        width = _user32.GetSystemMetrics(SM_CXSCREEN)
+        height = _user32.GetSystemMetrics(SM_CYSCREEN)
         return (0, 0, width, height)
     except Exception as e:
         logger.error(f"Failed to get system metrics: {e}")